@@ -4,14 +4,33 @@ from discord.ext import commands, tasks
 import aiohttp
 import asyncpg
 import asyncio
+import bisect
+import contextvars
+import heapq
 import os
 import io
 import json
 import logging
+import random
 import re
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone, time as dt_time
+from types import MappingProxyType
+from urllib.parse import quote, urlsplit
 from dotenv import load_dotenv
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 load_dotenv()
 #WYNN_API_KEY = os.getenv("WYNN_API_KEY")
 
@@ -31,6 +50,54 @@ DATABASE_URL = os.getenv("DATABASE_URL")
 # Database connection pool
 db_pool: asyncpg.Pool = None
 
+# Shared HTTP session for all upstream calls (created in setup_hook, closed on shutdown)
+http_session: aiohttp.ClientSession = None
+HTTP_CONNECTION_LIMIT = 100  # Total open sockets across all hosts
+HTTP_CONNECTION_LIMIT_PER_HOST = 20  # Per upstream (wynnextras, wynncraft, mojang, ...)
+HTTP_KEEPALIVE_TIMEOUT = 60  # Seconds an idle socket is kept warm
+HTTP_DNS_CACHE_TTL = 300  # Seconds a resolved address is reused
+
+# Per-upstream token buckets: host -> (requests per second, burst size)
+UPSTREAM_RATE_LIMITS = {
+    "api.wynncraft.com": (1.5, 10),
+    "api.mojang.com": (1.0, 5),
+    "wynnextras.com": (5.0, 20),
+}
+DEFAULT_RATE_LIMIT = (5.0, 20)
+RATE_LIMIT_DEFAULT_BACKOFF = 5  # Seconds to pause a host after a 429 without Retry-After
+
+# Request priority lanes: interactive slash-command fetches go ahead of background work
+PRIORITY_INTERACTIVE = 0
+PRIORITY_BACKGROUND = 1
+request_priority: contextvars.ContextVar[int] = contextvars.ContextVar("request_priority", default=PRIORITY_INTERACTIVE)
+
+# Per-interaction deadline (time.monotonic() value) that every upstream fetch honours
+INTERACTION_BUDGET = 10.0  # Seconds an interaction may spend on upstream calls
+OPTIONAL_ENRICHMENT_MIN_BUDGET = 3.0  # Skip extras such as the personalized score below this
+MIN_REQUEST_BUDGET = 0.5  # Don't start a request with less time than this left
+request_deadline: contextvars.ContextVar[float | None] = contextvars.ContextVar("request_deadline", default=None)
+
+# Upstream resilience: per-host total timeout (seconds), retries and circuit breaker
+UPSTREAM_TIMEOUTS = {
+    "api.wynncraft.com": 10,
+    "api.mojang.com": 5,
+    "wynnextras.com": 8,
+    "teslanator20.github.io": 15,
+}
+DEFAULT_UPSTREAM_TIMEOUT = 10
+UPSTREAM_MAX_RETRIES = 2  # Extra attempts for idempotent GETs
+RETRY_BACKOFF_BASE = 0.5  # Seconds; doubled per attempt with full jitter
+RETRY_BACKOFF_MAX = 4
+RETRYABLE_STATUSES = {429, 500, 502, 503, 504}
+CIRCUIT_FAILURE_THRESHOLD = 5  # Consecutive failed requests before the circuit opens
+CIRCUIT_OPEN_SECONDS = 30  # How long to fail fast before letting a probe through
+
+# Response bodies larger than this are decoded in a worker thread instead of on the event loop
+JSON_OFFLOAD_THRESHOLD = 256 * 1024
+
+# Conditional GET validators: url -> (ETag, Last-Modified, decoded body, body size in bytes)
+_conditional_cache: dict[str, tuple[str | None, str | None, object, int]] = {}
+
 RAID_TYPES = ["NOTG", "NOL", "TCC", "TNA", "TWP"]
 RAID_NAMES = {
     "NOTG": "Nest of the Grootslangs",
@@ -172,9 +239,310 @@ VALID_DUNGEONS = {
     "Corrupted Underworld Crypt",
 }
 
+# === HTTP Session ===
+def get_http_session() -> aiohttp.ClientSession:
+    """Return the shared aiohttp session, creating it (and its connection pool) if needed."""
+    global http_session
+    if http_session is None or http_session.closed:
+        connector = aiohttp.TCPConnector(
+            limit=HTTP_CONNECTION_LIMIT,
+            limit_per_host=HTTP_CONNECTION_LIMIT_PER_HOST,
+            keepalive_timeout=HTTP_KEEPALIVE_TIMEOUT,
+            ttl_dns_cache=HTTP_DNS_CACHE_TTL,
+        )
+        http_session = aiohttp.ClientSession(connector=connector)
+    return http_session
+
+
+async def close_http_session():
+    """Close the shared aiohttp session and release its sockets."""
+    global http_session
+    if http_session and not http_session.closed:
+        await http_session.close()
+    http_session = None
+
+
+class UpstreamRateLimiter:
+    """Token bucket for one upstream host, handing out tokens by priority lane."""
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+        self._waiters: list[tuple[int, int, asyncio.Future]] = []
+        self._seq = 0
+        self._dispatcher: asyncio.Task | None = None
+
+    def _refill(self, now: float):
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    async def acquire(self, priority: int = PRIORITY_INTERACTIVE):
+        """Wait for a token; lower priority values are served first."""
+        now = time.monotonic()
+        self._refill(now)
+        if not self._waiters and now >= self.blocked_until and self.tokens >= 1:
+            self.tokens -= 1
+            return
+
+        future = asyncio.get_running_loop().create_future()
+        self._seq += 1
+        heapq.heappush(self._waiters, (priority, self._seq, future))
+        if self._dispatcher is None or self._dispatcher.done():
+            self._dispatcher = asyncio.create_task(self._dispatch())
+        await future
+
+    async def _dispatch(self):
+        while self._waiters:
+            now = time.monotonic()
+            self._refill(now)
+            if now < self.blocked_until:
+                await asyncio.sleep(self.blocked_until - now)
+                continue
+            if self.tokens < 1:
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+                continue
+            _, _, future = heapq.heappop(self._waiters)
+            if future.done():
+                continue  # Caller gave up while queued
+            self.tokens -= 1
+            future.set_result(None)
+
+    def update_from_headers(self, status: int, headers):
+        """Adjust the bucket from Retry-After and RateLimit-* response headers."""
+        now = time.monotonic()
+        if status == 429:
+            delay = RATE_LIMIT_DEFAULT_BACKOFF
+            try:
+                delay = float(headers.get("Retry-After", delay))
+            except ValueError:
+                pass  # HTTP-date form; fall back to the default pause
+            self.blocked_until = max(self.blocked_until, now + delay)
+            self.tokens = 0
+
+        remaining = headers.get("RateLimit-Remaining")
+        if remaining is None:
+            return
+        try:
+            remaining = int(remaining)
+        except ValueError:
+            return
+        self.tokens = min(self.tokens, remaining)
+        if remaining <= 0:
+            try:
+                reset = float(headers.get("RateLimit-Reset", RATE_LIMIT_DEFAULT_BACKOFF))
+            except ValueError:
+                reset = RATE_LIMIT_DEFAULT_BACKOFF
+            self.blocked_until = max(self.blocked_until, now + reset)
+
+
+class CircuitBreaker:
+    """Fails fast once an upstream has failed repeatedly, letting one probe through per cooldown."""
+
+    def __init__(self):
+        self.failures = 0
+        self.open_until = 0.0
+
+    def allow(self) -> bool:
+        if self.failures < CIRCUIT_FAILURE_THRESHOLD:
+            return True
+        now = time.monotonic()
+        if now < self.open_until:
+            return False
+        # Half-open: this request is the probe, everyone else waits for another cooldown
+        self.open_until = now + CIRCUIT_OPEN_SECONDS
+        return True
+
+    def record_success(self):
+        self.failures = 0
+        self.open_until = 0.0
+
+    def record_failure(self):
+        self.failures += 1
+        if self.failures >= CIRCUIT_FAILURE_THRESHOLD:
+            self.open_until = time.monotonic() + CIRCUIT_OPEN_SECONDS
+
+
+_rate_limiters: dict[str, UpstreamRateLimiter] = {}
+_circuit_breakers: dict[str, CircuitBreaker] = {}
+
+
+def get_rate_limiter(host: str) -> UpstreamRateLimiter:
+    limiter = _rate_limiters.get(host)
+    if limiter is None:
+        rate, burst = UPSTREAM_RATE_LIMITS.get(host, DEFAULT_RATE_LIMIT)
+        limiter = UpstreamRateLimiter(rate, burst)
+        _rate_limiters[host] = limiter
+    return limiter
+
+
+def decode_json(raw: bytes):
+    """Decode a JSON document, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+async def decode_json_async(raw: bytes):
+    """Decode a JSON document, moving large payloads off the event loop thread."""
+    if len(raw) > JSON_OFFLOAD_THRESHOLD:
+        return await asyncio.get_running_loop().run_in_executor(None, decode_json, raw)
+    return decode_json(raw)
+
+
+def start_interaction_deadline(budget: float = INTERACTION_BUDGET):
+    """Start the upstream time budget for the interaction running in the current task."""
+    request_deadline.set(time.monotonic() + budget)
+
+
+def deadline_remaining() -> float | None:
+    """Seconds left before the current deadline, or None when there is no deadline."""
+    deadline = request_deadline.get()
+    if deadline is None:
+        return None
+    return deadline - time.monotonic()
+
+
+def has_budget(seconds: float) -> bool:
+    """Whether at least this many seconds remain on the current deadline."""
+    remaining = deadline_remaining()
+    return remaining is None or remaining >= seconds
+
+
+def get_circuit_breaker(host: str) -> CircuitBreaker:
+    breaker = _circuit_breakers.get(host)
+    if breaker is None:
+        breaker = CircuitBreaker()
+        _circuit_breakers[host] = breaker
+    return breaker
+
+
+async def fetch_json(url: str, params: dict = None, headers: dict = None, conditional: bool = False) -> tuple[int | None, object]:
+    """GET a JSON document through the shared session; see fetch_json_sized."""
+    status, data, _ = await fetch_json_sized(url, params, headers, conditional)
+    return status, data
+
+
+async def fetch_json_sized(url: str, params: dict = None, headers: dict = None, conditional: bool = False) -> tuple[int | None, object, int]:
+    """GET a JSON document as (status, data, nbytes); data is None unless the status is 200."""
+    # Timeouts, connection errors, 429 and 5xx are retried with jittered backoff;
+    # the request waits in its request_priority lane and gives up once request_deadline is nearly spent
+    host = urlsplit(url).hostname or ""
+    breaker = get_circuit_breaker(host)
+    if not breaker.allow():
+        logger.warning(f"Circuit open for {host}, skipping {url}")
+        return None, None, 0
+
+    limiter = get_rate_limiter(host)
+    timeout = aiohttp.ClientTimeout(total=UPSTREAM_TIMEOUTS.get(host, DEFAULT_UPSTREAM_TIMEOUT))
+    # Send back the last 200's validators; they are keyed by url alone so params may carry cache-busters
+    validators = _conditional_cache.get(url) if conditional else None
+    if validators:
+        etag, last_modified, _, _ = validators
+        headers = dict(headers or {})
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+    session = get_http_session()
+    status = None
+    error = None
+    cut_short = False  # The deadline, not the host, ended the last attempt
+
+    for attempt in range(UPSTREAM_MAX_RETRIES + 1):
+        if attempt:
+            backoff = random.uniform(0, min(RETRY_BACKOFF_MAX, RETRY_BACKOFF_BASE * 2 ** attempt))
+            if not has_budget(backoff + MIN_REQUEST_BUDGET):
+                cut_short = True
+                break
+            await asyncio.sleep(backoff)
+
+        remaining = deadline_remaining()
+        if remaining is not None and remaining < MIN_REQUEST_BUDGET:
+            logger.warning(f"Deadline reached before GET {url}")
+            return status, None, 0
+        try:
+            await asyncio.wait_for(limiter.acquire(request_priority.get()), remaining)
+        except asyncio.TimeoutError:
+            logger.warning(f"Deadline reached while waiting to GET {url}")
+            return status, None, 0
+
+        remaining = deadline_remaining()
+        attempt_timeout = timeout
+        if remaining is not None and remaining < timeout.total:
+            attempt_timeout = aiohttp.ClientTimeout(total=max(remaining, MIN_REQUEST_BUDGET))
+        try:
+            async with session.get(url, params=params, headers=headers, timeout=attempt_timeout) as resp:
+                status = resp.status
+                limiter.update_from_headers(status, resp.headers)
+                if status in RETRYABLE_STATUSES:
+                    error = None
+                    cut_short = False
+                    continue
+                if status != 200:
+                    breaker.record_success()
+                    if status == 304 and validators:  # Not modified: answer from the remembered body
+                        return 200, validators[2], validators[3]
+                    return status, None, 0
+                raw = await resp.read()
+                etag = resp.headers.get("ETag")
+                last_modified = resp.headers.get("Last-Modified")
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            status = None
+            error = e
+            cut_short = isinstance(e, asyncio.TimeoutError) and attempt_timeout is not timeout
+            continue
+        try:
+            data = await decode_json_async(raw)
+        except ValueError as e:  # Maintenance page or truncated body: a failed attempt like any other
+            status = None
+            error = e
+            cut_short = False
+            continue
+        breaker.record_success()
+        if conditional and (etag or last_modified):
+            _conditional_cache[url] = (etag, last_modified, data, len(raw))
+        return status, data, len(raw)
+
+    # Timeouts forced by a short interaction budget say nothing about the host's health
+    if status != 429 and not cut_short:
+        breaker.record_failure()
+    logger.warning(f"GET {url} failed after {UPSTREAM_MAX_RETRIES + 1} attempts: {error or f'HTTP {status}'}")
+    return status, None, 0
+
+
+class WynnExtrasTree(app_commands.CommandTree):
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        start_interaction_deadline()
+        return True
+
+
+class DeadlineView(discord.ui.View):
+    """Base view that starts the upstream time budget for each component interaction."""
+
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        start_interaction_deadline()
+        return True
+
+
+class WynnExtrasBot(commands.Bot):
+    async def setup_hook(self):
+        get_http_session()
+        if not reset_times_refresh.is_running():
+            reset_times_refresh.start()
+        if not roster_refresh.is_running():
+            roster_refresh.start()
+
+    async def close(self):
+        await super().close()
+        await close_http_session()
+
+
 intents = discord.Intents.default()
 intents.message_content = True
-bot = commands.Bot(command_prefix="!", intents=intents)
+bot = WynnExtrasBot(command_prefix="!", intents=intents, tree_cls=WynnExtrasTree)
 
 SCAM_ALERT_CHANNEL_ID = 1405529146351812829
 SCAM_ALERT_USER_ID = 716048545232322631
@@ -203,6 +571,23 @@ async def init_db():
                         player_name TEXT NOT NULL
                     )
                 ''')
+                await conn.execute('''
+                    ALTER TABLE linked_users ADD COLUMN IF NOT EXISTS player_uuid TEXT
+                ''')
+                await conn.execute('''
+                    CREATE TABLE IF NOT EXISTS player_uuid_cache (
+                        name_lower TEXT PRIMARY KEY,
+                        player_uuid TEXT,
+                        fetched_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+                    )
+                ''')
+                await conn.execute('''
+                    CREATE TABLE IF NOT EXISTS aspect_class_mapping (
+                        aspect_name TEXT PRIMARY KEY,
+                        class_name TEXT NOT NULL,
+                        fetched_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+                    )
+                ''')
                 await conn.execute('''
                     CREATE TABLE IF NOT EXISTS user_reminders (
                         discord_id BIGINT PRIMARY KEY,
@@ -230,15 +615,91 @@ async def get_linked_player(discord_id: int) -> str | None:
         return row['player_name'] if row else None
 
 
-async def set_linked_player(discord_id: int, player_name: str):
+async def get_linked_account(discord_id: int) -> tuple[str, str | None] | None:
+    """Get the linked (player_name, player_uuid); the UUID is None until it has been resolved."""
+    if not db_pool:
+        return None
+    async with db_pool.acquire() as conn:
+        row = await conn.fetchrow(
+            'SELECT player_name, player_uuid FROM linked_users WHERE discord_id = $1',
+            discord_id
+        )
+        return (row['player_name'], row['player_uuid']) if row else None
+
+
+async def set_linked_player(discord_id: int, player_name: str, player_uuid: str | None = None):
+    remember_player_name(player_name)
     if not db_pool:
         return
     async with db_pool.acquire() as conn:
         await conn.execute('''
-            INSERT INTO linked_users (discord_id, player_name)
-            VALUES ($1, $2)
-            ON CONFLICT (discord_id) DO UPDATE SET player_name = $2
-        ''', discord_id, player_name)
+            INSERT INTO linked_users (discord_id, player_name, player_uuid)
+            VALUES ($1, $2, $3)
+            ON CONFLICT (discord_id) DO UPDATE SET player_name = $2, player_uuid = $3
+        ''', discord_id, player_name, player_uuid)
+
+
+async def get_linked_accounts(discord_ids: list[int]) -> dict[int, tuple[str, str | None]]:
+    """Get the linked (player_name, player_uuid) of many users at once; unlinked users are left out."""
+    if not db_pool or not discord_ids:
+        return {}
+    async with db_pool.acquire() as conn:
+        rows = await conn.fetch(
+            'SELECT discord_id, player_name, player_uuid FROM linked_users WHERE discord_id = ANY($1::bigint[])',
+            list(discord_ids)
+        )
+        return {row['discord_id']: (row['player_name'], row['player_uuid']) for row in rows}
+
+
+async def get_linked_player_names() -> list[str]:
+    """Get every linked player name."""
+    if not db_pool:
+        return []
+    async with db_pool.acquire() as conn:
+        rows = await conn.fetch('SELECT DISTINCT player_name FROM linked_users')
+        return [row['player_name'] for row in rows]
+
+
+async def backfill_linked_uuids():
+    """Resolve and store UUIDs for links created before UUIDs were recorded."""
+    if not db_pool:
+        return
+    request_priority.set(PRIORITY_BACKGROUND)
+    async with db_pool.acquire() as conn:
+        rows = await conn.fetch('SELECT discord_id, player_name FROM linked_users WHERE player_uuid IS NULL')
+    if not rows:
+        return
+
+    logger.info(f"Backfilling UUIDs for {len(rows)} linked user(s)...")
+    filled = 0
+    for row in rows:
+        try:
+            player_uuid = await resolve_player_uuid(row['player_name'])
+        except Exception as e:
+            logger.warning(f"Could not resolve UUID for {row['player_name']}: {e}")
+            continue
+        if not player_uuid:
+            continue
+        async with db_pool.acquire() as conn:
+            await conn.execute(
+                'UPDATE linked_users SET player_uuid = $2 WHERE discord_id = $1 AND player_uuid IS NULL',
+                row['discord_id'], player_uuid
+            )
+        filled += 1
+    logger.info(f"Backfilled {filled}/{len(rows)} linked user UUID(s)")
+
+
+@tasks.loop(hours=1)
+async def linked_uuid_backfill():
+    """Retry links whose UUID couldn't be resolved and purge expired player UUID cache rows."""
+    try:
+        await backfill_linked_uuids()
+    except Exception as e:  # An exception would end the loop for good
+        logger.warning(f"Linked UUID backfill failed: {e}")
+    try:
+        await purge_cached_player_uuids()
+    except Exception as e:
+        logger.warning(f"Player UUID cache purge failed: {e}")
 
 
 async def remove_linked_player(discord_id: int) -> str | None:
@@ -252,6 +713,68 @@ async def remove_linked_player(discord_id: int) -> str | None:
         return row['player_name'] if row else None
 
 
+# === Player UUID Cache ===
+async def get_cached_player_uuid(name_lower: str) -> tuple[str | None, float] | None:
+    """Get a persisted (player_uuid, fetched_at) lookup; player_uuid is None for a cached miss."""
+    if not db_pool:
+        return None
+    async with db_pool.acquire() as conn:
+        row = await conn.fetchrow(
+            'SELECT player_uuid, fetched_at FROM player_uuid_cache WHERE name_lower = $1',
+            name_lower
+        )
+        return (row['player_uuid'], row['fetched_at'].timestamp()) if row else None
+
+
+async def store_cached_player_uuid(name_lower: str, player_uuid: str | None):
+    """Persist a name -> UUID lookup (or a not-found result when player_uuid is None)."""
+    if not db_pool:
+        return
+    async with db_pool.acquire() as conn:
+        await conn.execute('''
+            INSERT INTO player_uuid_cache (name_lower, player_uuid, fetched_at)
+            VALUES ($1, $2, NOW())
+            ON CONFLICT (name_lower) DO UPDATE SET player_uuid = $2, fetched_at = NOW()
+        ''', name_lower, player_uuid)
+
+
+async def purge_cached_player_uuids():
+    """Delete persisted name -> UUID lookups (and not-found results) that have expired."""
+    if not db_pool:
+        return
+    async with db_pool.acquire() as conn:
+        await conn.execute('''
+            DELETE FROM player_uuid_cache
+            WHERE fetched_at < NOW() - $1::int * INTERVAL '1 second'
+               OR (player_uuid IS NULL AND fetched_at < NOW() - $2::int * INTERVAL '1 second')
+        ''', PLAYER_UUID_CACHE_TTL, PLAYER_UUID_NEGATIVE_TTL)
+
+
+# === Aspect Class Mapping Snapshot ===
+async def load_aspect_class_snapshot() -> tuple[dict[str, str], float] | None:
+    """Get the persisted aspect -> class mapping and when it was fetched."""
+    if not db_pool:
+        return None
+    async with db_pool.acquire() as conn:
+        rows = await conn.fetch('SELECT aspect_name, class_name, fetched_at FROM aspect_class_mapping')
+        if not rows:
+            return None
+        return {row['aspect_name']: row['class_name'] for row in rows}, min(row['fetched_at'] for row in rows).timestamp()
+
+
+async def store_aspect_class_snapshot(mapping: dict[str, str]):
+    """Replace the persisted aspect -> class mapping."""
+    if not db_pool:
+        return
+    async with db_pool.acquire() as conn:
+        async with conn.transaction():
+            await conn.execute('DELETE FROM aspect_class_mapping')
+            await conn.executemany(
+                'INSERT INTO aspect_class_mapping (aspect_name, class_name) VALUES ($1, $2)',
+                list(mapping.items())
+            )
+
+
 # === User Reminders ===
 async def get_user_reminders(discord_id: int) -> dict | None:
     """Get reminder settings for a user."""
@@ -299,104 +822,481 @@ async def get_users_with_reminder(reminder_type: str) -> list[int]:
 
 
 # === API Functions ===
-async def fetch_gambits():
-    async with aiohttp.ClientSession() as session:
-        async with session.get(f"{BASE_URL}/gambit") as resp:
-            return await resp.json() if resp.status == 200 else None
+# Upstream fetches currently in flight, keyed by request identity
+_inflight_fetches: dict[str, asyncio.Task] = {}
 
 
-async def fetch_loot_pool(raid_type: str):
-    import time
+async def single_flight(key: str, fetch):
+    """Run fetch() once for all concurrent callers sharing the same key."""
+    # Late callers await the in-flight task instead of issuing their own request
+    task = _inflight_fetches.get(key)
+    if task is None:
+        task = asyncio.ensure_future(fetch())
+        _inflight_fetches[key] = task
+
+        def _clear(done: asyncio.Task):
+            if _inflight_fetches.get(key) is done:
+                del _inflight_fetches[key]
+
+        task.add_done_callback(_clear)
+    # Shielded so one caller being cancelled doesn't cancel the fetch for everyone else
+    return await asyncio.shield(task)
+
+
+# Strong references to fire-and-forget tasks so they aren't garbage collected mid-run
+_background_tasks: set[asyncio.Task] = set()
+
+
+def spawn_background(coro) -> asyncio.Task:
+    """Schedule a coroutine to run in the background without awaiting it."""
+    task = asyncio.create_task(coro)
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+    return task
+
+
+async def _revalidate_in_background(flight_key: str, download):
+    """Refresh a stale cache entry; on failure back off and keep serving the stale copy."""
+    request_priority.set(PRIORITY_BACKGROUND)
+    request_deadline.set(None)  # Not bound by the interaction that noticed the stale entry
+    try:
+        data = await single_flight(flight_key, download)
+    except Exception as e:
+        logger.warning(f"Background refresh of {flight_key} failed: {e}")
+        data = None
+    if data is None:
+        _refresh_retry_at[flight_key] = time.time() + REFRESH_RETRY_INTERVAL
+
+
+def reset_aware_expiry(fetched_at: float, last_reset: int, next_reset: int) -> tuple[float, bool]:
+    """Work out (expires_at, at_reset) for data fetched at fetched_at."""
+    # Right after a reset upstream may still serve the old data, so poll for a while
+    if 0 <= fetched_at - last_reset < RESET_POLL_WINDOW:
+        return fetched_at + RESET_POLL_INTERVAL, False
+    # at_reset: the entry expires because the reset rolled over
+    if next_reset <= fetched_at + RESET_CACHE_MAX_TTL:
+        return next_reset, True
+    # Capped so a late upstream update is still picked up
+    return fetched_at + RESET_CACHE_MAX_TTL, False
+
+
+def store_reset_aware(cache: dict, cache_time: dict, cache_expiry: dict, cache_key: str, data, reset_times):
+    """Store fetched data with an expiry tied to the reset clock from reset_times()."""
     now = time.time()
+    last_reset, next_reset = reset_times()
+    cache[cache_key] = data
+    cache_time[cache_key] = now
+    cache_expiry[cache_key] = reset_aware_expiry(now, last_reset, next_reset)
+
+
+async def fetch_cached(cache: dict, cache_time: dict, cache_expiry: dict, cache_key: str, flight_key: str, download):
+    """Return reset-aware cached data, refreshing it through single_flight when it expires."""
+    now = time.time()
+    if cache_key not in cache:
+        return await single_flight(flight_key, download)
+
+    expires_at, at_reset = cache_expiry.get(cache_key, (0, False))
+    if now < expires_at:
+        return cache[cache_key]
+
+    age = now - cache_time.get(cache_key, 0)
+    # Crossed a reset: the entry is known to be outdated, so refetch inline and only fall back to it on failure
+    if at_reset:
+        data = await single_flight(flight_key, download)
+        if data is None and POOL_STALE_WHILE_REVALIDATE and age < POOL_CACHE_MAX_STALE:
+            return cache[cache_key]
+        return data
+
+    # Expired on its TTL: serve it while one background refresh runs
+    if POOL_STALE_WHILE_REVALIDATE and age < POOL_CACHE_MAX_STALE:
+        if flight_key not in _inflight_fetches and now >= _refresh_retry_at.get(flight_key, 0):
+            spawn_background(_revalidate_in_background(flight_key, download))
+        return cache[cache_key]
+
+    return await single_flight(flight_key, download)
+
+
+# === Loot Pool Models ===
+# Pools are parsed once when a fetch fills the cache; renderers share them read-only
+LOOTRUN_RARITY_ORDER = ["Mythic", "Fabled", "Legendary", "Rare", "Set", "Unique"]
+
+
+@dataclass(frozen=True, slots=True)
+class Aspect:
+    name: str
+    rarity: str  # As sent by the API: "Mythic", "Fabled" or "Legendary"
+    rarity_key: str  # Lowercase rarity, the key of the tier/threshold tables
+    max_amount: int  # Amount at which the aspect is maxed
+
+    @classmethod
+    def from_json(cls, data: dict) -> "Aspect":
+        rarity = data.get("rarity", "")
+        rarity_key = rarity.lower()
+        return cls(data.get("name", ""), rarity, rarity_key, ASPECT_MAX_THRESHOLDS.get(rarity_key, 150))
+
+
+@dataclass(frozen=True, slots=True)
+class RaidPool:
+    raid_type: str
+    aspects: tuple[Aspect, ...]  # Sorted by rarity
+    by_rarity: MappingProxyType  # Read-only: rarity -> tuple[Aspect, ...]
+    mythics: tuple[Aspect, ...]
+
+    @classmethod
+    def from_json(cls, raid_type: str, data: dict) -> "RaidPool":
+        aspects = tuple(sorted(
+            (Aspect.from_json(a) for a in data.get("aspects", [])),
+            key=lambda a: RARITY_ORDER.get(a.rarity, 99)
+        ))
+        by_rarity = MappingProxyType({rarity: tuple(a for a in aspects if a.rarity == rarity) for rarity in RARITY_ORDER})
+        return cls(raid_type, aspects, by_rarity, by_rarity["Mythic"])
+
+
+@dataclass(frozen=True, slots=True)
+class LootItem:
+    name: str
+    rarity: str
+    type: str  # "normal", "shiny" or "tome"
+    shiny_stat: str  # Tracker stat with color codes stripped, "" if none
+    label: str  # Display line used in pool listings
+
+    @classmethod
+    def from_json(cls, data: dict) -> "LootItem":
+        name = data.get("name", "Unknown")
+        item_type = data.get("type", "normal")
+        shiny_stat = strip_color_codes(data.get("shinyStat", "")) if item_type == "shiny" else ""
+        if item_type == "shiny":
+            label = f"✨ {name} ({shiny_stat})" if shiny_stat else f"✨ {name}"
+        elif item_type == "tome":
+            label = f"📖 {name}"
+        else:
+            label = f"• {name}"
+        return cls(name, data.get("rarity", ""), item_type, shiny_stat, label)
+
+
+@dataclass(frozen=True, slots=True)
+class LootrunPool:
+    lootrun_type: str
+    items: tuple[LootItem, ...]  # Emerald blocks/liquids filtered out, sorted by rarity
+    by_rarity: MappingProxyType  # Read-only: rarity -> tuple[LootItem, ...]
+    shinies: tuple[LootItem, ...]
+    mythics: tuple[LootItem, ...]  # Non-shiny mythics
+
+    @classmethod
+    def from_json(cls, lootrun_type: str, data: dict) -> "LootrunPool":
+        rarity_order = {rarity: i for i, rarity in enumerate(LOOTRUN_RARITY_ORDER)}
+        unsorted = [LootItem.from_json(i) for i in filter_set_items(data.get("items", []))]
+        items = tuple(sorted(unsorted, key=lambda i: rarity_order.get(i.rarity, 99)))
+        return cls(
+            lootrun_type,
+            items,
+            MappingProxyType({rarity: tuple(i for i in items if i.rarity == rarity) for rarity in LOOTRUN_RARITY_ORDER}),
+            tuple(i for i in unsorted if i.type == "shiny"),
+            tuple(i for i in unsorted if i.rarity == "Mythic" and i.type != "shiny"),
+        )
+
+
+# Cache for today's gambits
+_gambit_cache: dict[str, dict] = {}
+_gambit_cache_time: dict[str, float] = {}
+_gambit_cache_expiry: dict[str, tuple[float, bool]] = {}
+
+
+async def fetch_gambits():
+    return await fetch_cached(
+        _gambit_cache, _gambit_cache_time, _gambit_cache_expiry, "gambits",
+        "gambits", _download_gambits,
+    )
+
+
+async def _download_gambits():
+    status, data = await fetch_json(f"{BASE_URL}/gambit", conditional=True)
+    if status == 200:
+        store_reset_aware(_gambit_cache, _gambit_cache_time, _gambit_cache_expiry, "gambits", data, get_gambit_reset_times)
+        return data
+    return None
 
-    # Check cache first
-    if raid_type in _loot_pool_cache:
-        cache_time = _loot_pool_cache_time.get(raid_type, 0)
-        if (now - cache_time) < LOOT_POOL_CACHE_TTL:
-            return _loot_pool_cache[raid_type]
-
-    async with aiohttp.ClientSession() as session:
-        async with session.get(f"{BASE_URL}/raid/loot-pool?raidType={raid_type}") as resp:
-            if resp.status == 200:
-                data = await resp.json()
-                _loot_pool_cache[raid_type] = data
-                _loot_pool_cache_time[raid_type] = now
-                return data
-            return None
+
+async def fetch_loot_pool(raid_type: str) -> RaidPool | None:
+    return await fetch_cached(
+        _loot_pool_cache, _loot_pool_cache_time, _loot_pool_cache_expiry, raid_type,
+        f"loot_pool:{raid_type}", lambda: _download_loot_pool(raid_type),
+    )
+
+
+async def _download_loot_pool(raid_type: str) -> RaidPool | None:
+    status, data = await fetch_json(f"{BASE_URL}/raid/loot-pool?raidType={raid_type}", conditional=True)
+    if status == 200:
+        pool = RaidPool.from_json(raid_type, data)
+        store_reset_aware(_loot_pool_cache, _loot_pool_cache_time, _loot_pool_cache_expiry, raid_type, pool, get_lootpool_reset_times)
+        return pool
+    return None
 
 
 # Cache for lootrun loot pools
-_lootrun_pool_cache: dict[str, dict] = {}
+_lootrun_pool_cache: dict[str, LootrunPool] = {}
 _lootrun_pool_cache_time: dict[str, float] = {}
-LOOTRUN_POOL_CACHE_TTL = 300  # 5 minutes
+_lootrun_pool_cache_expiry: dict[str, tuple[float, bool]] = {}
 
 
-async def fetch_lootrun_pool(lootrun_type: str):
+async def fetch_lootrun_pool(lootrun_type: str) -> LootrunPool | None:
     """Fetch lootrun loot pool from WynnExtras API."""
-    import time
-    now = time.time()
+    cache_key = f"lootrun_{lootrun_type}"
+    return await fetch_cached(
+        _lootrun_pool_cache, _lootrun_pool_cache_time, _lootrun_pool_cache_expiry, cache_key,
+        cache_key, lambda: _download_lootrun_pool(lootrun_type),
+    )
+
 
-    # Check cache first
+async def _download_lootrun_pool(lootrun_type: str) -> LootrunPool | None:
     cache_key = f"lootrun_{lootrun_type}"
-    if cache_key in _lootrun_pool_cache:
-        cache_time = _lootrun_pool_cache_time.get(cache_key, 0)
-        if (now - cache_time) < LOOTRUN_POOL_CACHE_TTL:
-            return _lootrun_pool_cache[cache_key]
-
-    async with aiohttp.ClientSession() as session:
-        async with session.get(f"{BASE_URL}/lootrun/loot-pool?lootrunType={lootrun_type}") as resp:
-            if resp.status == 200:
-                data = await resp.json()
-                _lootrun_pool_cache[cache_key] = data
-                _lootrun_pool_cache_time[cache_key] = now
-                return data
-            return None
+    status, data = await fetch_json(f"{BASE_URL}/lootrun/loot-pool?lootrunType={lootrun_type}", conditional=True)
+    if status == 200 and "items" in data:
+        pool = LootrunPool.from_json(lootrun_type, data)
+        store_reset_aware(_lootrun_pool_cache, _lootrun_pool_cache_time, _lootrun_pool_cache_expiry, cache_key, pool, get_lootrun_reset_times)
+        return pool
+    return None
 
 
-async def fetch_all_lootrun_pools() -> dict[str, list]:
+async def fetch_all_lootrun_pools() -> dict[str, LootrunPool]:
     """Fetch loot pools from all lootruns (parallel)."""
-    import asyncio
-
     results = await asyncio.gather(*[fetch_lootrun_pool(lr_type) for lr_type in LOOTRUN_TYPES])
+    return {lr_type: pool for lr_type, pool in zip(LOOTRUN_TYPES, results) if pool}
+
+
+# === Player Name Autocomplete ===
+# Names seen from links, lookups and the roster: lowercase name -> name as last seen
+_known_names: dict[str, str] = {}
+_known_names_sorted: list[str] = []  # Sorted lowercase keys of _known_names, for bisect
+_known_names_dirty = False  # Set after bulk additions; the sorted list is rebuilt on next use
+AUTOCOMPLETE_MAX_CHOICES = 25  # Discord's limit
 
-    all_pools = {}
-    for lr_type, data in zip(LOOTRUN_TYPES, results):
-        if data and "items" in data:
-            all_pools[lr_type] = data["items"]
-    return all_pools
+
+def remember_player_name(player_name: str):
+    """Add a single name to the autocomplete index."""
+    key = player_name.lower()
+    if key not in _known_names and not _known_names_dirty:
+        bisect.insort(_known_names_sorted, key)
+    _known_names[key] = player_name
+
+
+def remember_player_names(player_names):
+    """Add many names to the autocomplete index at once."""
+    global _known_names_dirty
+    for player_name in player_names:
+        _known_names[player_name.lower()] = player_name
+    _known_names_dirty = True
+
+
+def complete_player_name(prefix: str, limit: int = AUTOCOMPLETE_MAX_CHOICES) -> list[str]:
+    """Known player names starting with prefix (case-insensitive), alphabetically."""
+    global _known_names_sorted, _known_names_dirty
+    if _known_names_dirty:
+        _known_names_sorted = sorted(_known_names)
+        _known_names_dirty = False
+
+    key = prefix.strip().lower()
+    if not key:
+        return []
+    matches = []
+    for i in range(bisect.bisect_left(_known_names_sorted, key), len(_known_names_sorted)):
+        name = _known_names_sorted[i]
+        if not name.startswith(key) or len(matches) >= limit:
+            break
+        matches.append(_known_names[name])
+    return matches
+
+
+async def player_name_autocomplete(interaction: discord.Interaction, current: str) -> list[app_commands.Choice[str]]:
+    return [app_commands.Choice(name=name, value=name) for name in complete_player_name(current)]
+
+
+async def load_linked_player_names():
+    """Seed the autocomplete index with every linked player."""
+    try:
+        remember_player_names(await get_linked_player_names())
+    except Exception as e:
+        logger.warning(f"Loading linked player names failed: {e}")
+
+
+# === Aspect Upload Roster ===
+# Players who uploaded aspects to WynnExtras: lowercase name -> (playerUuid, playerName)
+_roster_index: dict[str, tuple[str, str]] = {}
+_roster_source: list | None = None  # Decoded /aspects/list body the index was last built from
+_roster_loaded_at: float = 0
+ROSTER_MISS_REFRESH_INTERVAL = 60  # Min seconds between on-demand refreshes for unknown names
+
+
+async def refresh_roster_index() -> bool:
+    """Sync the roster index with /aspects/list, applying only entries that changed."""
+    global _roster_source, _roster_loaded_at
+    status, players = await fetch_json(f"{BASE_URL}/aspects/list", conditional=True)
+    if status != 200 or not isinstance(players, list):
+        return False
+    _roster_loaded_at = time.time()
+    if players is _roster_source:
+        return True  # 304 Not Modified: nothing to apply
+
+    seen = set()
+    changed = []
+    for player in players:
+        name = player.get("playerName") or ""
+        player_uuid = player.get("playerUuid")
+        if not name or not player_uuid:
+            continue
+        key = name.lower()
+        seen.add(key)
+        entry = (player_uuid, name)
+        if _roster_index.get(key) != entry:
+            _roster_index[key] = entry
+            changed.append(name)
+    for key in _roster_index.keys() - seen:
+        del _roster_index[key]
+    if changed:
+        remember_player_names(changed)
+
+    _roster_source = players
+    return True
+
+
+async def resolve_roster_uuid(player_name: str) -> str | None:
+    """Look up a player's UUID in the roster index, refreshing it once for unknown names."""
+    key = player_name.lower()
+    entry = _roster_index.get(key)
+    if entry is None and time.time() - _roster_loaded_at >= ROSTER_MISS_REFRESH_INTERVAL:
+        await single_flight("roster", refresh_roster_index)
+        entry = _roster_index.get(key)
+    return entry[0] if entry else None
+
+
+@tasks.loop(minutes=10)
+async def roster_refresh():
+    """Keep the roster index in sync in the background."""
+    request_priority.set(PRIORITY_BACKGROUND)
+    try:
+        await single_flight("roster", refresh_roster_index)
+    except Exception as e:  # An exception would end the loop for good
+        logger.warning(f"Failed to refresh the aspect roster: {e}")
 
 
 async def fetch_player_aspects(player_name: str):
-    async with aiohttp.ClientSession() as session:
-        async with session.get(f"{BASE_URL}/aspects/list") as resp:
-            if resp.status != 200:
-                return None
-            players = await resp.json()
+    player_uuid = await resolve_roster_uuid(player_name)
+    if not player_uuid:
+        return None
 
-        player_uuid = None
-        for player in players:
-            if player.get("playerName", "").lower() == player_name.lower():
-                player_uuid = player.get("playerUuid")
-                break
+    status, data = await fetch_json(f"{BASE_URL}/aspects?playerUuid={player_uuid}")
+    return data if status == 200 else None
 
-        if not player_uuid:
-            return None
 
-        async with session.get(f"{BASE_URL}/aspects?playerUuid={player_uuid}") as resp:
-            return await resp.json() if resp.status == 200 else None
+def format_uuid(raw_uuid: str) -> str | None:
+    """Normalize a UUID to the hyphenated form, or None if it isn't one."""
+    raw_uuid = raw_uuid.replace("-", "")
+    if len(raw_uuid) != 32:
+        return None
+    return f"{raw_uuid[:8]}-{raw_uuid[8:12]}-{raw_uuid[12:16]}-{raw_uuid[16:20]}-{raw_uuid[20:]}"
+
+
+# Name -> UUID cache in front of Mojang: lowercase name -> (player_uuid or None, expires_at)
+_player_uuid_cache: OrderedDict[str, tuple[str | None, float]] = OrderedDict()
+PLAYER_UUID_CACHE_SIZE = 5000
+PLAYER_UUID_CACHE_TTL = 86400  # Names can change hands, so re-check daily
+PLAYER_UUID_NEGATIVE_TTL = 600  # "Player not found" is remembered for 10 minutes
+
+
+def _remember_player_uuid(name_lower: str, player_uuid: str | None, fetched_at: float):
+    ttl = PLAYER_UUID_CACHE_TTL if player_uuid else PLAYER_UUID_NEGATIVE_TTL
+    _player_uuid_cache[name_lower] = (player_uuid, fetched_at + ttl)
+    _player_uuid_cache.move_to_end(name_lower)
+    while len(_player_uuid_cache) > PLAYER_UUID_CACHE_SIZE:
+        _player_uuid_cache.popitem(last=False)
 
 
 async def fetch_player_uuid(player_name: str) -> str | None:
-    """Get player UUID from Mojang API."""
-    async with aiohttp.ClientSession() as session:
-        async with session.get(f"https://api.mojang.com/users/profiles/minecraft/{player_name}") as resp:
-            if resp.status == 200:
-                data = await resp.json()
-                raw_uuid = data.get("id", "")
-                # Format UUID with hyphens
-                if len(raw_uuid) == 32:
-                    return f"{raw_uuid[:8]}-{raw_uuid[8:12]}-{raw_uuid[12:16]}-{raw_uuid[16:20]}-{raw_uuid[20:]}"
-            return None
+    """Get player UUID from Mojang API, through the in-process LRU and Postgres caches."""
+    name_lower = player_name.lower()
+    now = time.time()
+
+    cached = _player_uuid_cache.get(name_lower)
+    if cached and now < cached[1]:
+        _player_uuid_cache.move_to_end(name_lower)
+        return cached[0]
+
+    try:
+        stored = await get_cached_player_uuid(name_lower)
+    except Exception as e:
+        logger.warning(f"Player UUID cache lookup failed: {e}")
+        stored = None
+    if stored:
+        player_uuid, fetched_at = stored
+        ttl = PLAYER_UUID_CACHE_TTL if player_uuid else PLAYER_UUID_NEGATIVE_TTL
+        if now < fetched_at + ttl:
+            _remember_player_uuid(name_lower, player_uuid, fetched_at)
+            return player_uuid
+
+    return await single_flight(f"player_uuid:{name_lower}", lambda: _download_player_uuid(name_lower))
+
+
+async def _download_player_uuid(name_lower: str) -> str | None:
+    status, data = await fetch_json(f"https://api.mojang.com/users/profiles/minecraft/{name_lower}")
+    if status == 200:
+        player_uuid = format_uuid(data.get("id", ""))
+    elif status in (204, 404):
+        player_uuid = None  # Player doesn't exist: negative-cache it
+    else:
+        return None  # Upstream trouble: don't cache anything
+
+    _remember_player_uuid(name_lower, player_uuid, time.time())
+    try:
+        await store_cached_player_uuid(name_lower, player_uuid)
+    except Exception as e:
+        logger.warning(f"Player UUID cache store failed: {e}")
+    return player_uuid
+
+
+async def resolve_player_uuid(player_name: str) -> str | None:
+    """Resolve a player name to a UUID, trying the roster index before Mojang."""
+    entry = _roster_index.get(player_name.lower())
+    if entry:
+        player_uuid = format_uuid(entry[0])
+        if player_uuid:
+            return player_uuid
+    return await fetch_player_uuid(player_name)
+
+
+async def fetch_linked_aspects(player_name: str, player_uuid: str | None):
+    """Fetch a linked player's aspects, going straight to the UUID when it is known."""
+    if player_uuid:
+        return await fetch_aspects_by_uuid(player_uuid)
+    return await fetch_player_aspects(player_name)
+
+
+ASPECT_BATCH_CONCURRENCY = 8  # Max /aspects requests in flight for one batch
+
+
+async def fetch_aspects_batch(players: list[str], concurrency: int = ASPECT_BATCH_CONCURRENCY) -> dict[str, dict | None]:
+    """Fetch aspects for many players, given as names or UUIDs: {player as given: data or None}."""
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def resolve(player: str) -> str | None:
+        player_uuid = format_uuid(player)
+        if player_uuid is None:
+            # Roster only: players missing from it haven't uploaded aspects
+            player_uuid = await resolve_roster_uuid(player)
+        return player_uuid.replace("-", "").lower() if player_uuid else None
+
+    async def fetch_one(player_uuid: str) -> dict | None:
+        async with semaphore:
+            try:
+                return await fetch_aspects_by_uuid(player_uuid)
+            except Exception as e:
+                logger.warning(f"Aspects fetch for {player_uuid} failed: {e}")
+                return None
+
+    # Each distinct UUID is fetched once, at most `concurrency` at a time on top of the rate limiter
+    uuids = await asyncio.gather(*(resolve(player) for player in players))
+    unique_uuids = list(dict.fromkeys(u for u in uuids if u))
+    results = dict(zip(unique_uuids, await asyncio.gather(*(fetch_one(u) for u in unique_uuids))))
+    return {player: results.get(player_uuid) for player, player_uuid in zip(players, uuids)}
 
 
 # Cache for aspect class mapping (name -> class)
@@ -405,43 +1305,95 @@ _aspect_cache_time: float = 0
 ASPECT_CACHE_TTL = 3600  # 1 hour
 
 # Cache for loot pools (raid_type -> data)
-_loot_pool_cache: dict[str, dict] = {}
+_loot_pool_cache: dict[str, RaidPool] = {}
 _loot_pool_cache_time: dict[str, float] = {}
-LOOT_POOL_CACHE_TTL = 300  # 5 minutes
+_loot_pool_cache_expiry: dict[str, tuple[float, bool]] = {}
+
+# Reset-aware expiry for raid pools, lootrun pools and gambits
+RESET_POLL_WINDOW = 1800  # Poll for new data for 30 minutes after a reset
+RESET_POLL_INTERVAL = 60  # How often to poll inside that window
+RESET_CACHE_MAX_TTL = 3600  # Upper bound on freshness outside the window
+
+# Stale-while-revalidate for pools and gambits: serve expired entries while
+# a background refresh runs, but never serve anything older than the hard max-age
+POOL_STALE_WHILE_REVALIDATE = os.getenv("POOL_STALE_WHILE_REVALIDATE", "1") != "0"
+POOL_CACHE_MAX_STALE = int(os.getenv("POOL_CACHE_MAX_STALE", 6 * 3600))  # 6 hours
+REFRESH_RETRY_INTERVAL = 30  # Seconds to wait after a failed background refresh
+_refresh_retry_at: dict[str, float] = {}
 
 
 async def get_aspect_class_mapping() -> dict[str, str]:
     """Fetch aspect -> class mapping from Wynncraft API, with caching."""
-    global _aspect_class_cache, _aspect_cache_time
-
-    import time
     now = time.time()
+    if not _aspect_class_cache:
+        return await single_flight("aspect_classes", _download_aspect_class_mapping) or {}
 
-    # Return cached data if still valid
-    if _aspect_class_cache and (now - _aspect_cache_time) < ASPECT_CACHE_TTL:
-        return _aspect_class_cache
+    # The mapping only changes with game updates, so an expired copy is served while it refreshes
+    if now - _aspect_cache_time >= ASPECT_CACHE_TTL:
+        if "aspect_classes" not in _inflight_fetches and now >= _refresh_retry_at.get("aspect_classes", 0):
+            spawn_background(_revalidate_in_background("aspect_classes", _download_aspect_class_mapping))
+    return _aspect_class_cache
 
-    mapping = {}
+
+async def _fetch_aspect_class(class_name: str) -> dict | None:
+    try:
+        status, data = await fetch_json(f"https://api.wynncraft.com/v3/aspects/{class_name}", conditional=True)
+    except Exception as e:
+        logger.warning(f"Error fetching aspects for {class_name}: {e}")
+        return None
+    return data if status == 200 else None
+
+
+async def _download_aspect_class_mapping() -> dict[str, str] | None:
+    global _aspect_class_cache, _aspect_cache_time
+
+    now = time.time()
     classes = ["warrior", "mage", "archer", "assassin", "shaman"]
+    results = await asyncio.gather(*(_fetch_aspect_class(class_name) for class_name in classes))
+    if all(data is None for data in results):
+        return None
 
-    async with aiohttp.ClientSession() as session:
-        for class_name in classes:
-            try:
-                async with session.get(f"https://api.wynncraft.com/v3/aspects/{class_name}") as resp:
-                    if resp.status == 200:
-                        data = await resp.json()
-                        for aspect_name, aspect_data in data.items():
-                            mapping[aspect_name] = class_name
-            except Exception as e:
-                print(f"Error fetching aspects for {class_name}: {e}")
+    mapping = {}
+    complete = True
+    for class_name, data in zip(classes, results):
+        if data is None:
+            # Keep what we already knew about this class rather than dropping it
+            complete = False
+            mapping.update((name, c) for name, c in _aspect_class_cache.items() if c == class_name)
+            continue
+        for aspect_name in data:
+            mapping[aspect_name] = class_name
 
-    if mapping:
-        _aspect_class_cache = mapping
-        _aspect_cache_time = now
+    _aspect_class_cache = mapping
+    if not complete:
+        # Leave the mapping expired so the missing classes are retried soon, not after ASPECT_CACHE_TTL
+        _refresh_retry_at["aspect_classes"] = now + REFRESH_RETRY_INTERVAL
+        return mapping
 
+    _aspect_cache_time = now
+    try:
+        await store_aspect_class_snapshot(mapping)
+    except Exception as e:
+        logger.warning(f"Aspect class snapshot store failed: {e}")
     return mapping
 
 
+async def load_aspect_class_mapping():
+    """Warm the aspect -> class mapping from its Postgres snapshot, refreshing it if outdated."""
+    global _aspect_class_cache, _aspect_cache_time
+
+    try:
+        snapshot = await load_aspect_class_snapshot()
+    except Exception as e:
+        logger.warning(f"Aspect class snapshot load failed: {e}")
+        snapshot = None
+    if snapshot and not _aspect_class_cache:
+        _aspect_class_cache, _aspect_cache_time = snapshot
+        logger.info(f"Loaded {len(_aspect_class_cache)} aspect classes from snapshot")
+    if not _aspect_class_cache or time.time() - _aspect_cache_time >= ASPECT_CACHE_TTL:
+        await _revalidate_in_background("aspect_classes", _download_aspect_class_mapping)
+
+
 def get_aspect_class(aspect_name: str, class_mapping: dict[str, str]) -> str | None:
     """Get class for an aspect from the mapping."""
     return class_mapping.get(aspect_name)
@@ -451,21 +1403,105 @@ async def fetch_aspects_by_uuid(uuid: str):
     """Fetch player aspects from WynnExtras API using UUID."""
     # Remove hyphens from UUID for API call
     clean_uuid = uuid.replace("-", "")
-    async with aiohttp.ClientSession() as session:
-        async with session.get(f"{BASE_URL}/aspects?playerUuid={clean_uuid}") as resp:
-            return await resp.json() if resp.status == 200 else None
-
-
-async def fetch_wynncraft_player(uuid: str) -> dict | None:
-    """Fetch full player data from Wynncraft API."""
-    async with aiohttp.ClientSession() as session:
-            url = f"https://api.wynncraft.com/v3/player/{uuid}?fullResult"
-            async with session.get(url) as resp:
-                if resp.status == 200:
-                    return await resp.json()
-                elif resp.status == 403:
-                    print("403: API key invalid or no access")
-                return None
+    status, data = await fetch_json(f"{BASE_URL}/aspects?playerUuid={clean_uuid}")
+    return data if status == 200 else None
+
+
+# Full player profiles: uuid -> (data, size in bytes, expires_at), least recently used first
+_player_profile_cache: OrderedDict[str, tuple[dict, int, float]] = OrderedDict()
+_player_profile_cache_bytes = 0
+PLAYER_PROFILE_CACHE_TTL = 120  # Seconds; short so playtime/levels stay fresh
+# Budget in raw JSON bytes as received; the decoded dicts take several times this much memory
+PLAYER_PROFILE_CACHE_MAX_BYTES = int(os.getenv("PLAYER_PROFILE_CACHE_MAX_BYTES", 32 * 1024 * 1024))
+
+
+def _get_cached_profile(uuid: str) -> dict | None:
+    entry = _player_profile_cache.get(uuid)
+    if entry is None:
+        return None
+    if time.time() >= entry[2]:
+        _drop_cached_profile(uuid)
+        return None
+    _player_profile_cache.move_to_end(uuid)
+    return entry[0]
+
+
+def _drop_cached_profile(uuid: str):
+    global _player_profile_cache_bytes
+    entry = _player_profile_cache.pop(uuid, None)
+    if entry is not None:
+        _player_profile_cache_bytes -= entry[1]
+
+
+def _remember_profile(uuid: str, data: dict, nbytes: int):
+    """Cache a decoded profile, evicting least recently used ones to stay under the byte budget."""
+    global _player_profile_cache_bytes
+    _drop_cached_profile(uuid)
+    if nbytes > PLAYER_PROFILE_CACHE_MAX_BYTES:
+        return
+    _player_profile_cache[uuid] = (data, nbytes, time.time() + PLAYER_PROFILE_CACHE_TTL)
+    _player_profile_cache_bytes += nbytes
+    while _player_profile_cache_bytes > PLAYER_PROFILE_CACHE_MAX_BYTES:
+        _, (_, evicted_bytes, _) = _player_profile_cache.popitem(last=False)
+        _player_profile_cache_bytes -= evicted_bytes
+
+
+async def fetch_wynncraft_player(uuid: str, refresh: bool = False) -> dict | None:
+    """Fetch full player data from Wynncraft API, through a short-lived profile cache."""
+    if not refresh:
+        cached = _get_cached_profile(uuid)
+        if cached is not None:
+            return cached
+    return await single_flight(f"player_profile:{uuid}", lambda: _download_wynncraft_player(uuid))
+
+
+async def _download_wynncraft_player(uuid: str) -> dict | None:
+    url = f"https://api.wynncraft.com/v3/player/{uuid}?fullResult"
+    status, data, nbytes = await fetch_json_sized(url)
+    if status == 200:
+        if data:
+            _remember_profile(uuid, data, nbytes)
+        return data
+    elif status == 403:
+        logger.warning(f"Wynncraft player profile {uuid} got 403: API key invalid or no access")
+    return None
+
+
+# Resolve /pv usernames with a single Wynncraft call instead of Mojang + Wynncraft
+PV_RESOLVE_VIA_WYNNCRAFT = os.getenv("PV_RESOLVE_VIA_WYNNCRAFT", "1") != "0"
+
+
+async def fetch_wynncraft_player_by_name(player_name: str, refresh: bool = False) -> tuple[str | None, dict | None]:
+    """Fetch full player data by username as (uuid, data); uuid is None if the player doesn't exist."""
+    if not PV_RESOLVE_VIA_WYNNCRAFT:
+        uuid = await fetch_player_uuid(player_name)
+        return uuid, (await fetch_wynncraft_player(uuid, refresh) if uuid else None)
+
+    # A name we resolved recently whose profile is still cached needs no request at all
+    known = _player_uuid_cache.get(player_name.lower())
+    if not refresh and known and known[0] and time.time() < known[1]:
+        cached = _get_cached_profile(known[0])
+        if cached is not None:
+            return known[0], cached
+
+    # Wynncraft accepts usernames and returns the UUID in the body, so this is usually the only request
+    url = f"https://api.wynncraft.com/v3/player/{quote(player_name)}?fullResult"
+    status, data, nbytes = await fetch_json_sized(url)
+    if status == 200 and data:
+        uuid = format_uuid(data.get("uuid") or "")
+        if uuid:
+            _remember_player_uuid(player_name.lower(), uuid, time.time())
+            _remember_profile(uuid, data, nbytes)
+            return uuid, data
+    elif status == 403:
+        logger.warning("Wynncraft player lookup got 403: API key invalid or no access")
+
+    # 300 (several players have used the name), 404 or an upstream failure: resolve through Mojang,
+    # so a missing player and a Wynncraft outage get different answers
+    uuid = await fetch_player_uuid(player_name)
+    if not uuid or status == 404:
+        return uuid, None  # After a 404 a known UUID means they never played Wynncraft
+    return uuid, await fetch_wynncraft_player(uuid, refresh)
 
 
 # Rank colors/badges
@@ -598,25 +1634,107 @@ def calculate_aspect_score(rarity: str, amount: int) -> float:
     return remaining * weight
 
 
-def calculate_pool_score(pool_aspects: list, player_aspects: dict, raid_type: str = None) -> float:
+@dataclass(frozen=True, slots=True)
+class TierStep:
+    score: float  # Score contribution of the aspect at this amount
+    current_tier: int  # 0 once maxed
+    progress: int  # Amount collected into the current tier
+    tier_size: int  # Amount the current tier spans
+
+
+MAXED_TIER_STEP = TierStep(0.0, 0, 0, 0)
+
+
+def compute_tier_step(rarity: str, amount: int) -> TierStep:
+    """Score and tier progress for one aspect, computed from the threshold and weight tables."""
+    current_tier, _, _ = get_tier_info(rarity, amount)
+    if current_tier == 0:
+        return MAXED_TIER_STEP
+    thresholds = TIER_THRESHOLDS.get(rarity.lower(), [1, 15, 75])
+    tier_start = thresholds[current_tier - 1] if current_tier > 1 else 0
+    tier_end = thresholds[current_tier] if current_tier < len(thresholds) else thresholds[-1]
+    return TierStep(calculate_aspect_score(rarity, amount), current_tier, amount - tier_start, tier_end - tier_start)
+
+
+# Per lowercase rarity: TierStep for every amount from 0 up to (not including) the max
+ASPECT_TIER_TABLES = {
+    rarity_key: tuple(compute_tier_step(rarity_key, amount) for amount in range(thresholds[-1]))
+    for rarity_key, thresholds in TIER_THRESHOLDS.items()
+}
+
+
+def tier_step(rarity_key: str, amount: int) -> TierStep:
+    """Look up score and tier progress for an aspect of the given lowercase rarity."""
+    table = ASPECT_TIER_TABLES.get(rarity_key)
+    if table is None or not isinstance(amount, int) or amount < 0:
+        return compute_tier_step(rarity_key, amount)
+    return table[amount] if amount < len(table) else MAXED_TIER_STEP
+
+
+def calculate_pool_score(pool_aspects: tuple[Aspect, ...], player_aspects: dict, raid_type: str = None) -> float:
     """Calculate total score for a loot pool based on player progress."""
     total_score = 0.0
 
     for aspect in pool_aspects:
-        name = aspect.get("name", "")
-        rarity = aspect.get("rarity", "")
+        # Add score contribution for the player's current amount of this aspect
+        total_score += tier_step(aspect.rarity_key, player_aspects.get(aspect.name, 0)).score
 
-        # Get player's current amount for this aspect
-        player_amount = player_aspects.get(name, 0)
+    return total_score
 
-        # Add score contribution
-        total_score += calculate_aspect_score(rarity, player_amount)
 
-    return total_score
+# Score per owned amount for each rarity, with a trailing 0.0 that clipped (maxed) amounts index into
+_TIER_SCORE_ARRAYS = {
+    rarity_key: np.array([step.score for step in table] + [0.0])
+    for rarity_key, table in ASPECT_TIER_TABLES.items()
+} if np is not None else {}
+
+
+def score_raids_batch(pools: dict[str, RaidPool], players: dict, raid_types: list[str] = RAID_TYPES) -> dict:
+    """Score players ({key: {aspect name: amount}}) against every raid pool: {key: {raid_type: score}}."""
+    raid_types = [raid_type for raid_type in raid_types if raid_type in pools]
+    if np is None or not players or not raid_types:
+        return _score_raids_python(pools, players, raid_types)
+
+    # Pool membership as an aspect x raid count matrix, progress as a player x aspect score
+    # matrix read from the tier tables; one matrix product gives every score
+    columns: dict[tuple[str, str], int] = {}
+    for raid_type in raid_types:
+        for aspect in pools[raid_type].aspects:
+            columns.setdefault((aspect.name, aspect.rarity_key), len(columns))
+    membership = np.zeros((len(columns), len(raid_types)))
+    for j, raid_type in enumerate(raid_types):
+        for aspect in pools[raid_type].aspects:
+            membership[columns[(aspect.name, aspect.rarity_key)], j] += 1
+
+    keys = list(players)
+    rows = [[players[key].get(name, 0) for name, _ in columns] for key in keys]
+    if not all(isinstance(amount, int) for row in rows for amount in row):
+        return _score_raids_python(pools, players, raid_types)  # int64 would truncate fractional amounts
+    amounts = np.array(rows, dtype=np.int64).reshape(len(keys), len(columns))
+
+    scores = np.zeros(amounts.shape)
+    rarity_keys = [rarity_key for _, rarity_key in columns]
+    for rarity_key in set(rarity_keys):
+        cols = [i for i, key in enumerate(rarity_keys) if key == rarity_key]
+        lookup = _TIER_SCORE_ARRAYS.get(rarity_key)
+        if lookup is None:
+            # No table for this rarity: use the reference scoring
+            for i in cols:
+                scores[:, i] = [tier_step(rarity_key, int(amount)).score for amount in amounts[:, i]]
+        else:
+            scores[:, cols] = lookup[np.clip(amounts[:, cols], 0, len(lookup) - 1)]
+    for p, i in np.argwhere(amounts < 0):
+        scores[p, i] = tier_step(rarity_keys[i], int(amounts[p, i])).score
 
+    totals = scores @ membership
+    return {key: dict(zip(raid_types, totals[p].tolist())) for p, key in enumerate(keys)}
 
-def sort_aspects_by_rarity(aspects: list) -> list:
-    return sorted(aspects, key=lambda a: RARITY_ORDER.get(a.get("rarity", ""), 99))
+
+def _score_raids_python(pools: dict[str, RaidPool], players: dict, raid_types: list[str]) -> dict:
+    return {
+        key: {raid_type: calculate_pool_score(pools[raid_type].aspects, amounts) for raid_type in raid_types}
+        for key, amounts in players.items()
+    }
 
 
 def get_aspect_emoji(required_class: str | None) -> str:
@@ -629,9 +1747,12 @@ def get_aspect_emoji(required_class: str | None) -> str:
 
 async def fetch_reset_times() -> dict | None:
     """Fetch reset times from the API."""
-    async with aiohttp.ClientSession() as session:
-        async with session.get(RESET_TIME_URL) as resp:
-            return await resp.json() if resp.status == 200 else None
+    return await single_flight("reset_times", _download_reset_times)
+
+
+async def _download_reset_times() -> dict | None:
+    status, data = await fetch_json(RESET_TIME_URL, conditional=True)
+    return data if status == 200 else None
 
 
 def compute_weekly_timestamps(day: str, hour: int, minute: int, tz_name: str) -> tuple[int, int]:
@@ -649,61 +1770,97 @@ def compute_weekly_timestamps(day: str, hour: int, minute: int, tz_name: str) ->
     return int(last_reset_dt.timestamp()), int(next_reset_dt.timestamp())
 
 
-async def get_lootpool_reset_times() -> tuple[int, int]:
-    """Get Unix timestamps for last and next lootpool (raid aspects) reset."""
-    data = await fetch_reset_times()
-    if data and "lootpool_reset" in data:
-        r = data["lootpool_reset"]
+def compute_daily_timestamps(hour: int, minute: int, tz_name: str) -> tuple[int, int]:
+    """Compute (last_reset, next_reset) Unix timestamps for a daily reset."""
+    tz = timezone.utc if tz_name.upper() == "UTC" else timezone(timedelta(hours=1))
+    now = datetime.now(tz)
+    reset_today = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
+    if now < reset_today:
+        last_reset_dt = reset_today - timedelta(days=1)
+    else:
+        last_reset_dt = reset_today
+    next_reset_dt = last_reset_dt + timedelta(days=1)
+    return int(last_reset_dt.timestamp()), int(next_reset_dt.timestamp())
+
+
+# === Reset Time Service ===
+# Last good /api/reset-times payload, refreshed in the background by reset_times_refresh
+_reset_times_data: dict = {}
+# Precomputed (last_reset, next_reset) per reset kind, recomputed once next_reset passes
+_reset_windows: dict[str, tuple[int, int]] = {}
+
+
+def _compute_reset_window(kind: str) -> tuple[int, int]:
+    r = _reset_times_data.get(kind)
+    if kind == "gambit_reset":
+        if r:
+            return compute_daily_timestamps(r["hour"], r["minute"], r.get("timezone", "UTC"))
+        return compute_daily_timestamps(0, 0, "UTC")
+    if r:
         return compute_weekly_timestamps(r["day"], r["hour"], r["minute"], r["timezone"])
+    if kind == "lootrun_reset":
+        return compute_weekly_timestamps("FRIDAY", 18, 0, "UTC")
     return compute_weekly_timestamps("FRIDAY", 17, 0, "UTC")
 
 
-async def get_gambit_reset_times() -> tuple[int, int]:
-    """Get Unix timestamps for last and next daily gambit reset."""
-    data = await fetch_reset_times()
-    if data and "gambit_reset" in data:
-        g = data["gambit_reset"]
-        tz = timezone.utc if g.get("timezone", "UTC").upper() == "UTC" else timezone(timedelta(hours=1))
-        now = datetime.now(tz)
-        reset_today = now.replace(hour=g["hour"], minute=g["minute"], second=0, microsecond=0)
-        if now < reset_today:
-            last_reset_dt = reset_today - timedelta(days=1)
-        else:
-            last_reset_dt = reset_today
-        next_reset_dt = last_reset_dt + timedelta(days=1)
-        return int(last_reset_dt.timestamp()), int(next_reset_dt.timestamp())
-    now = datetime.now(timezone.utc)
-    reset_today = now.replace(hour=0, minute=0, second=0, microsecond=0)
-    if now < reset_today:
-        reset_today -= timedelta(days=1)
-    return int(reset_today.timestamp()), int((reset_today + timedelta(days=1)).timestamp())
+def get_reset_window(kind: str) -> tuple[int, int]:
+    """Return the cached (last_reset, next_reset) for a reset kind without any network I/O."""
+    window = _reset_windows.get(kind)
+    if window is None or time.time() >= window[1]:
+        window = _compute_reset_window(kind)
+        _reset_windows[kind] = window
+    return window
 
 
-async def get_lootrun_reset_times() -> tuple[int, int]:
-    """Get Unix timestamps for last and next lootrun pool reset."""
+async def refresh_reset_times() -> bool:
+    """Reload the reset schedule, keeping the last good value if the API is unavailable."""
+    global _reset_times_data
     data = await fetch_reset_times()
-    if data and "lootrun_reset" in data:
-        r = data["lootrun_reset"]
-        return compute_weekly_timestamps(r["day"], r["hour"], r["minute"], r["timezone"])
-    return compute_weekly_timestamps("FRIDAY", 18, 0, "UTC")
+    if not data:
+        return False
+    _reset_times_data = data
+    _reset_windows.clear()
+    return True
 
 
-async def fetch_all_mythics() -> list[dict]:
-    """Fetch mythic aspects from all raids (parallel)."""
-    import asyncio
+RESET_TIMES_REFRESH_HOURS = 6
+RESET_TIMES_RETRY_MINUTES = 5  # Retry interval while the schedule can't be fetched
 
-    # Fetch all raids in parallel
-    results = await asyncio.gather(*[fetch_loot_pool(raid_type) for raid_type in RAID_TYPES])
 
-    all_mythics = []
-    for raid_type, data in zip(RAID_TYPES, results):
-        if data:
-            for aspect in data.get("aspects", []):
-                if aspect.get("rarity") == "Mythic":
-                    aspect_copy = aspect.copy()
-                    aspect_copy["raid"] = raid_type
-                    all_mythics.append(aspect_copy)
-    return all_mythics
+@tasks.loop(hours=RESET_TIMES_REFRESH_HOURS)
+async def reset_times_refresh():
+    """Refresh the reset schedule a few times a day, retrying sooner after a failure."""
+    request_priority.set(PRIORITY_BACKGROUND)
+    try:
+        refreshed = await refresh_reset_times()
+    except Exception as e:  # An exception would end the loop for good
+        logger.warning(f"Failed to refresh reset times: {e}")
+        refreshed = False
+    if refreshed:
+        reset_times_refresh.change_interval(hours=RESET_TIMES_REFRESH_HOURS)
+    else:
+        reset_times_refresh.change_interval(minutes=RESET_TIMES_RETRY_MINUTES)
+
+
+def get_lootpool_reset_times() -> tuple[int, int]:
+    """Get Unix timestamps for last and next lootpool (raid aspects) reset."""
+    return get_reset_window("lootpool_reset")
+
+
+def get_gambit_reset_times() -> tuple[int, int]:
+    """Get Unix timestamps for last and next daily gambit reset."""
+    return get_reset_window("gambit_reset")
+
+
+def get_lootrun_reset_times() -> tuple[int, int]:
+    """Get Unix timestamps for last and next lootrun pool reset."""
+    return get_reset_window("lootrun_reset")
+
+
+async def fetch_all_raid_pools() -> dict[str, RaidPool]:
+    """Fetch loot pools from all raids (parallel)."""
+    results = await asyncio.gather(*[fetch_loot_pool(raid_type) for raid_type in RAID_TYPES])
+    return {raid_type: pool for raid_type, pool in zip(RAID_TYPES, results) if pool}
 
 
 def has_image_attachment(message: discord.Message) -> bool:
@@ -985,10 +2142,20 @@ async def handle_scam_image_message(message: discord.Message) -> bool:
 
 
 # === Bot Events ===
+_startup_loads_started: bool = False
+
+
 @bot.event
 async def on_ready():
+    global _startup_loads_started
     # Initialize database connection
     await init_db()
+    if not linked_uuid_backfill.is_running():
+        linked_uuid_backfill.start()
+    if not _startup_loads_started:
+        _startup_loads_started = True
+        spawn_background(load_aspect_class_mapping())
+        spawn_background(load_linked_player_names())
 
     logger.info(f"Logged in as {bot.user}")
     logger.info(f"Bot ID: {bot.user.id}")
@@ -1029,7 +2196,7 @@ _last_reminder_lootrun: int = 0
 
 async def build_lootrun_reminder_embed() -> discord.Embed:
     """Build an embed with current lootrun pools for reminders."""
-    _, next_reset = await get_lootrun_reset_times()
+    _, next_reset = get_lootrun_reset_times()
     all_pools = await fetch_all_lootrun_pools()
 
     embed = discord.Embed(
@@ -1040,28 +2207,10 @@ async def build_lootrun_reminder_embed() -> discord.Embed:
 
     if all_pools:
         for lr_type in LOOTRUN_TYPES:
-            items = all_pools.get(lr_type, [])
-            if items:
-                items = filter_set_items(items)
-                shinies = [i for i in items if i.get("type") == "shiny"]
-                shiny_lines = []
-                for shiny in shinies:
-                    shiny_name = shiny.get("name", "Unknown")
-                    shiny_stat = strip_color_codes(shiny.get("shinyStat", ""))
-                    if shiny_stat:
-                        shiny_lines.append(f"✨ {shiny_name} ({shiny_stat})")
-                    else:
-                        shiny_lines.append(f"✨ {shiny_name}")
-
-                mythics = [i for i in items if i.get("rarity") == "Mythic" and i.get("type") != "shiny"]
-                mythic_lines = [f"• {m.get('name', 'Unknown')}" for m in mythics]
-
-                field_lines.append("**Mythics:**")
-                field_lines = []
-                if shiny_lines:
-                    field_lines.extend(shiny_lines)
-                if mythic_lines:
-                    field_lines.extend(mythic_lines)
+            pool = all_pools.get(lr_type)
+            if pool and pool.items:
+                field_lines = [shiny.label for shiny in pool.shinies]
+                field_lines.extend(f"• {m.name}" for m in pool.mythics)
 
                 if not field_lines:
                     field_lines.append("*No shinies or mythics*")
@@ -1074,10 +2223,27 @@ async def build_lootrun_reminder_embed() -> discord.Embed:
     return embed
 
 
-async def build_raidpool_reminder_embed() -> discord.Embed:
-    """Build an embed with current raid pools for reminders."""
-    _, next_reset = await get_lootpool_reset_times()
-    mythics = await fetch_all_mythics()
+async def score_linked_users(discord_ids: list[int]) -> dict[int, dict[str, float]]:
+    """Score every raid pool for each linked user, fetching all their aspects in one batch."""
+    accounts = await get_linked_accounts(discord_ids)
+    if not accounts:
+        return {}
+    pools = await fetch_all_raid_pools()
+    aspects = await fetch_aspects_batch([player_uuid or name for name, player_uuid in accounts.values()])
+
+    players = {}
+    for discord_id, (name, player_uuid) in accounts.items():
+        data = aspects.get(player_uuid or name)
+        player_aspects = {pa.get("name", ""): pa.get("amount", 0) for pa in (data or {}).get("aspects", [])}
+        if player_aspects:
+            players[discord_id] = player_aspects
+    return score_raids_batch(pools, players)
+
+
+async def build_raidpool_reminder_embed(scores: dict[str, float] = None) -> discord.Embed:
+    """Build an embed with current raid pools for reminders, with the user's scores if given."""
+    _, next_reset = get_lootpool_reset_times()
+    pools = await fetch_all_raid_pools()
 
     embed = discord.Embed(
         title="Raid Pools - Resetting Soon!",
@@ -1085,19 +2251,25 @@ async def build_raidpool_reminder_embed() -> discord.Embed:
         color=0x5C005C
     )
 
-    if mythics:
+    if any(pool.mythics for pool in pools.values()):
         class_mapping = await get_aspect_class_mapping()
         for raid_type in RAID_TYPES:
-            raid_mythics = [m for m in mythics if m.get("raid") == raid_type]
-            if raid_mythics:
+            pool = pools.get(raid_type)
+            if pool and pool.mythics:
                 aspect_lines = []
-                for m in raid_mythics:
-                    aspect_name = m['name']
+                for m in pool.mythics:
+                    aspect_name = m.name
                     aspect_class = get_aspect_class(aspect_name, class_mapping)
                     flame_emoji = get_aspect_emoji(aspect_class)
                     aspect_lines.append(f"{flame_emoji} {aspect_name}")
 
                 field_name = f"{RAID_EMOJIS[raid_type]} {raid_type}"
+                if scores and raid_type in scores:
+                    pool_score = scores[raid_type]
+                    if pool_score == 0:
+                        field_name += " (MAXED)"
+                    else:
+                        field_name += f" (Score: {pool_score:.1f})"
                 embed.add_field(name=field_name, value="\n".join(aspect_lines), inline=False)
 
     return embed
@@ -1106,7 +2278,7 @@ async def build_raidpool_reminder_embed() -> discord.Embed:
 async def build_gambits_reminder_embed() -> discord.Embed:
     """Build an embed with today's gambits for reminders."""
     data = await fetch_gambits()
-    _, next_reset = await get_gambit_reset_times()
+    _, next_reset = get_gambit_reset_times()
 
     embed = discord.Embed(
         title="Today's Gambits",
@@ -1126,10 +2298,11 @@ async def reminder_check():
     """Check if it's time to send weekly reset reminders (1 hour before each pool reset)."""
     global _last_reminder_raidpool, _last_reminder_lootrun
     import time
+    request_priority.set(PRIORITY_BACKGROUND)
 
     current_time = int(time.time())
-    _, next_lootpool = await get_lootpool_reset_times()
-    _, next_lootrun = await get_lootrun_reset_times()
+    _, next_lootpool = get_lootpool_reset_times()
+    _, next_lootrun = get_lootrun_reset_times()
 
     send_raidpool = 0 < (next_lootpool - current_time) <= 3600 and _last_reminder_raidpool != next_lootpool
     send_lootrun = 0 < (next_lootrun - current_time) <= 3600 and _last_reminder_lootrun != next_lootrun
@@ -1148,6 +2321,12 @@ async def reminder_check():
     lootrunpool_users = await get_users_with_reminder("lootrunpool") if send_lootrun else []
 
     raidpool_embed = await build_raidpool_reminder_embed() if raidpool_users else None
+    raidpool_scores = {}
+    if raidpool_embed:
+        try:
+            raidpool_scores = await score_linked_users(raidpool_users)
+        except Exception as e:
+            logger.error(f"Failed to score raid pools for reminders: {e}")
     lootrunpool_embed = await build_lootrun_reminder_embed() if lootrunpool_users else None
 
     all_users = set(raidpool_users + lootrunpool_users)
@@ -1159,7 +2338,10 @@ async def reminder_check():
                 if reminders:
                     embeds_to_send = []
                     if reminders.get("raidpool") and raidpool_embed:
-                        embeds_to_send.append(raidpool_embed)
+                        if discord_id in raidpool_scores:
+                            embeds_to_send.append(await build_raidpool_reminder_embed(raidpool_scores[discord_id]))
+                        else:
+                            embeds_to_send.append(raidpool_embed)
                     if reminders.get("lootrunpool") and lootrunpool_embed:
                         embeds_to_send.append(lootrunpool_embed)
                     if embeds_to_send:
@@ -1171,28 +2353,20 @@ async def reminder_check():
 
 _last_known_gambits: set[str] = set()
 _gambit_reminder_sent_today: bool = False
-_gambit_trigger_date: object = None
+_gambit_trigger_reset: int = 0
 
 
 @tasks.loop(minutes=5)
 async def gambit_reminder_trigger():
     """Trigger gambit polling around the daily gambit reset time from the API."""
-    global _gambit_reminder_sent_today, _gambit_trigger_date
-
-    reset_data = await fetch_reset_times()
-    if not reset_data or "gambit_reset" not in reset_data:
-        return
-
-    g = reset_data["gambit_reset"]
-    tz = timezone.utc if g.get("timezone", "UTC").upper() == "UTC" else timezone(timedelta(hours=1))
-    now = datetime.now(tz)
-    today = now.date()
+    global _gambit_reminder_sent_today, _gambit_trigger_reset
 
-    reset_dt = now.replace(hour=g["hour"], minute=g["minute"], second=0, microsecond=0)
-    seconds_since_reset = (now - reset_dt).total_seconds()
+    # Falls back to the default UTC midnight reset while the schedule is unavailable
+    last_reset, _ = get_gambit_reset_times()
+    seconds_since_reset = time.time() - last_reset
 
-    if 0 <= seconds_since_reset < 300 and _gambit_trigger_date != today:
-        _gambit_trigger_date = today
+    if 0 <= seconds_since_reset < 300 and _gambit_trigger_reset != last_reset:
+        _gambit_trigger_reset = last_reset
         _gambit_reminder_sent_today = False
         logger.info("Starting gambit polling for new gambits...")
         if not gambit_poll_loop.is_running():
@@ -1204,6 +2378,7 @@ async def gambit_poll_loop():
     """Poll for new gambits every 30 seconds after the gambit reset time."""
     global _last_known_gambits, _gambit_reminder_sent_today
     import asyncio
+    request_priority.set(PRIORITY_BACKGROUND)
 
     # Stop if we already sent today
     if _gambit_reminder_sent_today:
@@ -1211,16 +2386,11 @@ async def gambit_poll_loop():
         return
 
     # Timeout after 30 minutes of polling
-    reset_data = await fetch_reset_times()
-    if reset_data and "gambit_reset" in reset_data:
-        g = reset_data["gambit_reset"]
-        tz = timezone.utc if g.get("timezone", "UTC").upper() == "UTC" else timezone(timedelta(hours=1))
-        now = datetime.now(tz)
-        reset_dt = now.replace(hour=g["hour"], minute=g["minute"], second=0, microsecond=0)
-        if (now - reset_dt).total_seconds() > 1800:
-            logger.info("Gambit polling timeout - stopping")
-            gambit_poll_loop.stop()
-            return
+    last_reset, _ = get_gambit_reset_times()
+    if time.time() - last_reset > 1800:
+        logger.info("Gambit polling timeout - stopping")
+        gambit_poll_loop.stop()
+        return
 
     # Fetch current gambits
     data = await fetch_gambits()
@@ -1275,7 +2445,7 @@ async def gambits(interaction: discord.Interaction):
         await interaction.followup.send("No gambits available for today.", ephemeral=True)
         return
 
-    _, next_reset = await get_gambit_reset_times()
+    _, next_reset = get_gambit_reset_times()
     embed = discord.Embed(
         title="🎲 Today's Gambits",
         description=f"**Refreshes in:** <t:{next_reset}:R>",
@@ -1286,7 +2456,7 @@ async def gambits(interaction: discord.Interaction):
     await interaction.followup.send(embed=embed)
 
 
-class ReminderSettingsView(discord.ui.View):
+class ReminderSettingsView(DeadlineView):
     """View with toggle buttons for reminder settings."""
     def __init__(self, user_id: int, gambit: bool = False, raidpool: bool = False, lootrunpool: bool = False):
         super().__init__(timeout=300)
@@ -1476,7 +2646,7 @@ async def remindme(
 # =============================================================================
 
 
-class LootPoolTypeView(discord.ui.View):
+class LootPoolTypeView(DeadlineView):
     """View with buttons to choose between Raid and Lootrun pools."""
     def __init__(self, original_user_id: int = None):
         super().__init__(timeout=300)
@@ -1503,7 +2673,7 @@ class LootPoolTypeView(discord.ui.View):
         await show_lootrun_overview(interaction, edit=True, original_user_id=self.original_user_id)
 
 
-class RaidButtonsView(discord.ui.View):
+class RaidButtonsView(DeadlineView):
     def __init__(self, original_user_id: int = None):
         super().__init__(timeout=300)
         self.original_user_id = original_user_id
@@ -1550,7 +2720,7 @@ class RaidButtonsView(discord.ui.View):
         await show_raid_pool_edit(interaction, "TWP", original_user_id=self.original_user_id)
 
 
-class LootrunButtonsView(discord.ui.View):
+class LootrunButtonsView(DeadlineView):
     """View with buttons for selecting lootruns."""
     def __init__(self, original_user_id: int = None):
         super().__init__(timeout=300)
@@ -1612,7 +2782,7 @@ class LootrunButtonsView(discord.ui.View):
         await show_lootrun_pool_edit(interaction, "EFF", original_user_id=self.original_user_id)
 
 
-class BackToLootrunOverviewView(discord.ui.View):
+class BackToLootrunOverviewView(DeadlineView):
     """View for lootrun pool detail with back button."""
     def __init__(self, lootrun_type: str = None, original_user_id: int = None):
         super().__init__(timeout=300)
@@ -1640,7 +2810,7 @@ class BackToLootrunOverviewView(discord.ui.View):
 
 async def show_lootrun_overview(interaction: discord.Interaction, edit: bool = False, original_user_id: int = None):
     """Show the weekly lootrun pools overview."""
-    last_reset, next_reset = await get_lootrun_reset_times()
+    last_reset, next_reset = get_lootrun_reset_times()
 
     # Fetch all lootrun pools
     all_pools = await fetch_all_lootrun_pools()
@@ -1653,25 +2823,11 @@ async def show_lootrun_overview(interaction: discord.Interaction, edit: bool = F
 
     if all_pools:
         for lr_type in LOOTRUN_TYPES:
-            items = all_pools.get(lr_type, [])
-            if items:
-                # Filter out emerald blocks and liquids from set items
-                items = filter_set_items(items)
-
-                # Get shinies with their tracker stat
-                shinies = [i for i in items if i.get("type") == "shiny"]
-                shiny_lines = []
-                for shiny in shinies:
-                    shiny_name = shiny.get("name", "Unknown")
-                    shiny_stat = strip_color_codes(shiny.get("shinyStat", ""))
-                    if shiny_stat:
-                        shiny_lines.append(f"✨ {shiny_name} ({shiny_stat})")
-                    else:
-                        shiny_lines.append(f"✨ {shiny_name}")
-
-                # Get all mythics (non-shiny)
-                mythics = [i for i in items if i.get("rarity") == "Mythic" and i.get("type") != "shiny"]
-                mythic_lines = [f"• {m.get('name', 'Unknown')}" for m in mythics]
+            pool = all_pools.get(lr_type)
+            if pool and pool.items:
+                # Shinies with their tracker stat, then non-shiny mythics
+                shiny_lines = [shiny.label for shiny in pool.shinies]
+                mythic_lines = [f"• {m.name}" for m in pool.mythics]
 
                 field_lines = []
                 if shiny_lines:
@@ -1704,9 +2860,9 @@ async def show_lootrun_overview_edit(interaction: discord.Interaction, original_
 
 async def show_lootrun_pool_edit(interaction: discord.Interaction, lootrun_type: str, original_user_id: int = None):
     """Show loot pool for a specific lootrun (edit version)."""
-    data = await fetch_lootrun_pool(lootrun_type)
+    pool = await fetch_lootrun_pool(lootrun_type)
 
-    if not data or "items" not in data:
+    if not pool:
         await interaction.edit_original_response(
             content=f"No loot pool available for {LOOTRUN_NAMES.get(lootrun_type, lootrun_type)}.",
             embeds=[],
@@ -1714,15 +2870,6 @@ async def show_lootrun_pool_edit(interaction: discord.Interaction, lootrun_type:
         )
         return
 
-    items = data.get("items", [])
-
-    # Filter out emerald blocks and liquids from set items
-    items = filter_set_items(items)
-
-    # Sort items by rarity
-    rarity_order = {"Mythic": 0, "Fabled": 1, "Legendary": 2, "Rare": 3, "Set": 4, "Unique": 5}
-    items = sorted(items, key=lambda i: rarity_order.get(i.get("rarity", ""), 99))
-
     title = f"{LOOTRUN_EMOJIS.get(lootrun_type, '<:lootrun:1466173956884136188>')} {LOOTRUN_NAMES.get(lootrun_type, lootrun_type)} Loot Pool"
 
     embed = discord.Embed(
@@ -1730,7 +2877,7 @@ async def show_lootrun_pool_edit(interaction: discord.Interaction, lootrun_type:
         color=0x8B008B
     )
 
-    if not items:
+    if not pool.items:
         embed.description = "No items in the loot pool."
         await interaction.edit_original_response(embeds=[embed], view=BackToLootrunOverviewView(lootrun_type, original_user_id=original_user_id))
         return
@@ -1738,27 +2885,12 @@ async def show_lootrun_pool_edit(interaction: discord.Interaction, lootrun_type:
     embeds = [embed]
 
     # Group items by rarity
-    for rarity in ["Mythic", "Fabled", "Legendary", "Rare", "Set", "Unique"]:
-        rarity_items = [i for i in items if i.get("rarity") == rarity]
+    for rarity in LOOTRUN_RARITY_ORDER:
+        rarity_items = pool.by_rarity[rarity]
         if not rarity_items:
             continue
 
-        item_lines = []
-        for item in rarity_items:
-            item_name = item.get("name", "Unknown")
-            item_type = item.get("type", "normal")
-
-            # Add shiny indicator if applicable
-            if item_type == "shiny":
-                shiny_stat = strip_color_codes(item.get("shinyStat", ""))
-                if shiny_stat:
-                    item_lines.append(f"✨ {item_name} ({shiny_stat})")
-                else:
-                    item_lines.append(f"✨ {item_name}")
-            elif item_type == "tome":
-                item_lines.append(f"📖 {item_name}")
-            else:
-                item_lines.append(f"• {item_name}")
+        item_lines = [item.label for item in rarity_items]
 
         rarity_color = RARITY_COLORS.get(rarity, 0x808080)
         rarity_embed = discord.Embed(
@@ -1773,22 +2905,13 @@ async def show_lootrun_pool_edit(interaction: discord.Interaction, lootrun_type:
 
 async def show_lootrun_pool(interaction: discord.Interaction, lootrun_type: str, followup: bool = True, original_user_id: int = None):
     """Show loot pool for a specific lootrun."""
-    data = await fetch_lootrun_pool(lootrun_type)
+    pool = await fetch_lootrun_pool(lootrun_type)
 
-    if not data or "items" not in data:
+    if not pool:
         if followup:
             await interaction.followup.send(f"No loot pool available for {LOOTRUN_NAMES.get(lootrun_type, lootrun_type)}.", ephemeral=True)
         return
 
-    items = data.get("items", [])
-
-    # Filter out emerald blocks and liquids from set items
-    items = filter_set_items(items)
-
-    # Sort items by rarity
-    rarity_order = {"Mythic": 0, "Fabled": 1, "Legendary": 2, "Rare": 3, "Set": 4, "Unique": 5}
-    items = sorted(items, key=lambda i: rarity_order.get(i.get("rarity", ""), 99))
-
     title = f"{LOOTRUN_EMOJIS.get(lootrun_type, '<:lootrun:1466173956884136188>')} {LOOTRUN_NAMES.get(lootrun_type, lootrun_type)} Loot Pool"
 
     embed = discord.Embed(
@@ -1796,7 +2919,7 @@ async def show_lootrun_pool(interaction: discord.Interaction, lootrun_type: str,
         color=0x8B008B
     )
 
-    if not items:
+    if not pool.items:
         embed.description = "No items in the loot pool."
         await interaction.followup.send(embed=embed, view=BackToLootrunOverviewView(lootrun_type, original_user_id=original_user_id))
         return
@@ -1804,27 +2927,12 @@ async def show_lootrun_pool(interaction: discord.Interaction, lootrun_type: str,
     embeds = [embed]
 
     # Group items by rarity
-    for rarity in ["Mythic", "Fabled", "Legendary", "Rare", "Set", "Unique"]:
-        rarity_items = [i for i in items if i.get("rarity") == rarity]
+    for rarity in LOOTRUN_RARITY_ORDER:
+        rarity_items = pool.by_rarity[rarity]
         if not rarity_items:
             continue
 
-        item_lines = []
-        for item in rarity_items:
-            item_name = item.get("name", "Unknown")
-            item_type = item.get("type", "normal")
-
-            # Add shiny indicator if applicable
-            if item_type == "shiny":
-                shiny_stat = strip_color_codes(item.get("shinyStat", ""))
-                if shiny_stat:
-                    item_lines.append(f"✨ {item_name} ({shiny_stat})")
-                else:
-                    item_lines.append(f"✨ {item_name}")
-            elif item_type == "tome":
-                item_lines.append(f"📖 {item_name}")
-            else:
-                item_lines.append(f"• {item_name}")
+        item_lines = [item.label for item in rarity_items]
 
         rarity_color = RARITY_COLORS.get(rarity, 0x808080)
         rarity_embed = discord.Embed(
@@ -1839,16 +2947,16 @@ async def show_lootrun_pool(interaction: discord.Interaction, lootrun_type: str,
 
 async def show_aspects_overview(interaction: discord.Interaction, edit: bool = False, original_user_id: int = None):
     """Show the weekly loot pools overview."""
-    last_reset, next_reset = await get_lootpool_reset_times()
+    last_reset, next_reset = get_lootpool_reset_times()
 
-    # Fetch all mythic aspects
-    mythics = await fetch_all_mythics()
+    # Fetch all raid pools
+    pools = await fetch_all_raid_pools()
 
     # Check if user is linked and fetch their aspects
-    linked_player = await get_linked_player(interaction.user.id)
+    linked_player, linked_uuid = await get_linked_account(interaction.user.id) or (None, None)
     player_aspects = {}
-    if linked_player:
-        player_data = await fetch_player_aspects(linked_player)
+    if linked_player and has_budget(OPTIONAL_ENRICHMENT_MIN_BUDGET):
+        player_data = await fetch_linked_aspects(linked_player, linked_uuid)
         if player_data:
             for pa in player_data.get("aspects", []):
                 player_aspects[pa.get("name", "")] = pa.get("amount", 0)
@@ -1861,33 +2969,24 @@ async def show_aspects_overview(interaction: discord.Interaction, edit: bool = F
     )
 
     # Group mythics by raid, each raid in its own field
-    if mythics:
+    if any(pool.mythics for pool in pools.values()):
         # Fetch class mapping to get flame emojis
         class_mapping = await get_aspect_class_mapping()
 
-        # Fetch full loot pools to calculate scores
-        raid_pools = {}
-        if player_aspects:
-            import asyncio
-            results = await asyncio.gather(*[fetch_loot_pool(raid_type) for raid_type in RAID_TYPES])
-            for raid_type, data in zip(RAID_TYPES, results):
-                if data:
-                    raid_pools[raid_type] = data.get("aspects", [])
-
         for raid_type in RAID_TYPES:
-            raid_mythics = [m for m in mythics if m.get("raid") == raid_type]
-            if raid_mythics:
+            pool = pools.get(raid_type)
+            if pool and pool.mythics:
                 aspect_lines = []
-                for m in raid_mythics:
-                    aspect_name = m['name']
+                for m in pool.mythics:
+                    aspect_name = m.name
                     aspect_class = get_aspect_class(aspect_name, class_mapping)
                     flame_emoji = get_aspect_emoji(aspect_class)
                     aspect_lines.append(f"{flame_emoji} {aspect_name}")
 
                 # Build field name with score if linked
                 field_name = f"{RAID_EMOJIS[raid_type]} {raid_type}"
-                if player_aspects and raid_type in raid_pools:
-                    pool_score = calculate_pool_score(raid_pools[raid_type], player_aspects)
+                if player_aspects:
+                    pool_score = calculate_pool_score(pool.aspects, player_aspects)
                     if pool_score == 0:
                         field_name += " (MAXED)"
                     else:
@@ -1930,6 +3029,57 @@ async def raidpool(interaction: discord.Interaction, raid: app_commands.Choice[s
     await show_raid_pool(interaction, raid.value, followup=True, original_user_id=interaction.user.id)
 
 
+@bot.tree.command(name="bestraid", description="Rank this week's raids by your personal score")
+async def bestraid(interaction: discord.Interaction):
+    await interaction.response.defer()
+
+    linked_player, linked_uuid = await get_linked_account(interaction.user.id) or (None, None)
+    if not linked_player:
+        await interaction.followup.send("You don't have a linked account. Use `/link` first to see your scores.", ephemeral=True)
+        return
+
+    # Pools come from the reset-aware cache; the player's aspects are the only per-user fetch
+    pools, player_data = await asyncio.gather(fetch_all_raid_pools(), fetch_linked_aspects(linked_player, linked_uuid))
+    if not pools:
+        await interaction.followup.send("No loot pool data available yet.", ephemeral=True)
+        return
+    if not player_data:
+        await interaction.followup.send(f"Could not fetch aspects for **{linked_player}**. Make sure they've been uploaded with the WynnExtras mod.", ephemeral=True)
+        return
+
+    player_aspects = {pa.get("name", ""): pa.get("amount", 0) for pa in player_data.get("aspects", [])}
+    scores = {raid_type: calculate_pool_score(pool.aspects, player_aspects) for raid_type, pool in pools.items()}
+    ranked = sorted(pools, key=lambda raid_type: (-scores[raid_type], RAID_TYPES.index(raid_type)))
+
+    _, next_reset = get_lootpool_reset_times()
+    embed = discord.Embed(
+        title="🏆 Best Raids This Week",
+        description=f"Ranked by **{linked_player}**'s score\n**Refreshes in:** <t:{next_reset}:R>",
+        color=0x5C005C
+    )
+
+    for place, raid_type in enumerate(ranked, start=1):
+        pool = pools[raid_type]
+        pool_score = scores[raid_type]
+        field_name = f"{place}. {RAID_EMOJIS.get(raid_type, '')} {RAID_NAMES.get(raid_type, raid_type)}"
+
+        if pool_score == 0:
+            embed.add_field(name=field_name, value="**Score:** MAXED", inline=False)
+            continue
+
+        # Aspects that contribute most to this raid's score
+        contributions = [(tier_step(a.rarity_key, player_aspects.get(a.name, 0)).score, a.name) for a in pool.aspects]
+        open_aspects = sorted((c for c in contributions if c[0] > 0), key=lambda c: -c[0])
+        lines = [
+            f"**Score:** {pool_score:.2f}",
+            f"{len(open_aspects)}/{len(pool.aspects)} aspects not maxed",
+        ]
+        lines.extend(f"• {name} ({score:.1f})" for score, name in open_aspects[:3])
+        embed.add_field(name=field_name, value="\n".join(lines), inline=False)
+
+    await interaction.followup.send(embed=embed)
+
+
 class LinkAccountModal(discord.ui.Modal, title="Link Minecraft Account"):
     username = discord.ui.TextInput(
         label="Minecraft Username",
@@ -1944,11 +3094,15 @@ class LinkAccountModal(discord.ui.Modal, title="Link Minecraft Account"):
         self.raid_type = raid_type
         self.original_user_id = original_user_id
 
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        start_interaction_deadline()
+        return True
+
     async def on_submit(self, interaction: discord.Interaction):
         player_name = self.username.value.strip()
 
         # Try to fetch player to verify they exist
-        uuid = await fetch_player_uuid(player_name)
+        uuid = await resolve_player_uuid(player_name)
         if not uuid:
             await interaction.response.send_message(
                 f"Could not find player **{player_name}**. Please check the spelling.",
@@ -1957,7 +3111,7 @@ class LinkAccountModal(discord.ui.Modal, title="Link Minecraft Account"):
             return
 
         # Link the account
-        await set_linked_player(interaction.user.id, player_name)
+        await set_linked_player(interaction.user.id, player_name, uuid)
 
         # Defer the response so we can edit the original message
         await interaction.response.defer()
@@ -1969,7 +3123,7 @@ class LinkAccountModal(discord.ui.Modal, title="Link Minecraft Account"):
             await show_aspects_overview_edit(interaction, original_user_id=self.original_user_id)
 
 
-class BackToOverviewView(discord.ui.View):
+class BackToOverviewView(DeadlineView):
     # Filter modes: "all", "maxed", "non_maxed"
     def __init__(self, raid_type: str = None, filter_mode: str = "all", is_linked: bool = False, original_user_id: int = None):
         super().__init__(timeout=300)
@@ -2035,14 +3189,14 @@ class BackToOverviewView(discord.ui.View):
 
 async def show_aspects_overview_edit(interaction: discord.Interaction, original_user_id: int = None):
     """Show the weekly loot pools overview (edit version)."""
-    last_reset, next_reset = await get_lootpool_reset_times()
-    mythics = await fetch_all_mythics()
+    last_reset, next_reset = get_lootpool_reset_times()
+    pools = await fetch_all_raid_pools()
 
     # Check if user is linked and fetch their aspects
-    linked_player = await get_linked_player(interaction.user.id)
+    linked_player, linked_uuid = await get_linked_account(interaction.user.id) or (None, None)
     player_aspects = {}
-    if linked_player:
-        player_data = await fetch_player_aspects(linked_player)
+    if linked_player and has_budget(OPTIONAL_ENRICHMENT_MIN_BUDGET):
+        player_data = await fetch_linked_aspects(linked_player, linked_uuid)
         if player_data:
             for pa in player_data.get("aspects", []):
                 player_aspects[pa.get("name", "")] = pa.get("amount", 0)
@@ -2053,33 +3207,24 @@ async def show_aspects_overview_edit(interaction: discord.Interaction, original_
         color=0x5C005C
     )
 
-    if mythics:
+    if any(pool.mythics for pool in pools.values()):
         # Fetch class mapping to get flame emojis
         class_mapping = await get_aspect_class_mapping()
 
-        # Fetch full loot pools to calculate scores
-        raid_pools = {}
-        if player_aspects:
-            import asyncio
-            results = await asyncio.gather(*[fetch_loot_pool(raid_type) for raid_type in RAID_TYPES])
-            for raid_type, data in zip(RAID_TYPES, results):
-                if data:
-                    raid_pools[raid_type] = data.get("aspects", [])
-
         for raid_type in RAID_TYPES:
-            raid_mythics = [m for m in mythics if m.get("raid") == raid_type]
-            if raid_mythics:
+            pool = pools.get(raid_type)
+            if pool and pool.mythics:
                 aspect_lines = []
-                for m in raid_mythics:
-                    aspect_name = m['name']
+                for m in pool.mythics:
+                    aspect_name = m.name
                     aspect_class = get_aspect_class(aspect_name, class_mapping)
                     flame_emoji = get_aspect_emoji(aspect_class)
                     aspect_lines.append(f"{flame_emoji} {aspect_name}")
 
                 # Build field name with score if linked
                 field_name = f"{RAID_EMOJIS[raid_type]} {raid_type}"
-                if player_aspects and raid_type in raid_pools:
-                    pool_score = calculate_pool_score(raid_pools[raid_type], player_aspects)
+                if player_aspects:
+                    pool_score = calculate_pool_score(pool.aspects, player_aspects)
                     if pool_score == 0:
                         field_name += " (MAXED)"
                     else:
@@ -2094,27 +3239,29 @@ async def show_aspects_overview_edit(interaction: discord.Interaction, original_
 
 async def show_raid_pool_edit(interaction: discord.Interaction, raid_type: str, filter_mode: str = "all", original_user_id: int = None):
     """Show loot pool for a specific raid (edit version)."""
-    data = await fetch_loot_pool(raid_type)
-    linked_player = await get_linked_player(interaction.user.id)
+    pool = await fetch_loot_pool(raid_type)
+    linked_player, linked_uuid = await get_linked_account(interaction.user.id) or (None, None)
     is_linked = bool(linked_player)
 
-    if not data:
+    if not pool:
         await interaction.edit_original_response(content=f"No loot pool available for {raid_type}.", embeds=[], view=BackToOverviewView(raid_type, is_linked=is_linked, original_user_id=original_user_id))
         return
 
-    aspects_list = sort_aspects_by_rarity(data.get("aspects", []))
+    aspects_list = pool.aspects
     score_text = None
     player_aspects = {}
 
-    if linked_player:
-        player_data = await fetch_player_aspects(linked_player)
+    if linked_player and not has_budget(OPTIONAL_ENRICHMENT_MIN_BUDGET):
+        score_text = "*Your score is unavailable right now, try again in a moment.*"
+    elif linked_player:
+        player_data = await fetch_linked_aspects(linked_player, linked_uuid)
         if player_data:
             for pa in player_data.get("aspects", []):
                 name = pa.get("name", "")
                 amount = pa.get("amount", 0)
                 player_aspects[name] = amount
 
-            pool_score = calculate_pool_score(aspects_list, player_aspects, raid_type)
+            pool_score = calculate_pool_score(pool.aspects, player_aspects)
             if pool_score == 0:
                 score_text = "**Your Score:** MAXED"
             else:
@@ -2145,22 +3292,21 @@ async def show_raid_pool_edit(interaction: discord.Interaction, raid_type: str,
 
     embeds = [embed]
     for rarity in ["Mythic", "Fabled", "Legendary"]:
-        rarity_aspects = [a for a in aspects_list if a.get("rarity") == rarity]
+        rarity_aspects = pool.by_rarity[rarity]
         if not rarity_aspects:
             continue
 
         aspect_lines = []
         for aspect in rarity_aspects:
-            aspect_name = aspect.get("name", "")
-            aspect_rarity = aspect.get("rarity", "").lower()
+            aspect_name = aspect.name
+            aspect_rarity = aspect.rarity_key
             required_class = get_aspect_class(aspect_name, class_mapping)
 
             # Check if user has maxed this aspect
             is_maxed = False
             player_amount = player_aspects.get(aspect_name, 0)
             if aspect_name in player_aspects:
-                max_threshold = ASPECT_MAX_THRESHOLDS.get(aspect_rarity, 150)
-                is_maxed = player_amount >= max_threshold
+                is_maxed = player_amount >= aspect.max_amount
 
             # Apply filter
             if filter_mode == "maxed" and not is_maxed:
@@ -2178,16 +3324,9 @@ async def show_raid_pool_edit(interaction: discord.Interaction, raid_type: str,
             # Build display text with progress for non-maxed filter
             display_text = f"{emoji} {aspect_name}"
             if filter_mode == "non_maxed" and player_aspects:
-                current_tier, target_tier, remaining = get_tier_info(aspect_rarity, player_amount)
-                if current_tier > 0:
-                    # Get tier thresholds to show progress
-                    thresholds = TIER_THRESHOLDS.get(aspect_rarity, [1, 15, 75])
-                    if current_tier <= len(thresholds):
-                        tier_start = thresholds[current_tier - 1] if current_tier > 1 else 0
-                        tier_end = thresholds[current_tier] if current_tier < len(thresholds) else thresholds[-1]
-                        progress_in_tier = player_amount - tier_start
-                        tier_size = tier_end - tier_start
-                        display_text += f" ({progress_in_tier}/{tier_size})"
+                step = tier_step(aspect_rarity, player_amount)
+                if step.current_tier > 0:
+                    display_text += f" ({step.progress}/{step.tier_size})"
 
             aspect_lines.append(display_text)
 
@@ -2211,28 +3350,30 @@ async def show_raid_pool_edit(interaction: discord.Interaction, raid_type: str,
 
 async def show_raid_pool(interaction: discord.Interaction, raid_type: str, followup: bool = True, edit: bool = False, filter_mode: str = "all", original_user_id: int = None):
     """Show loot pool for a specific raid."""
-    linked_player = await get_linked_player(interaction.user.id)
+    linked_player, linked_uuid = await get_linked_account(interaction.user.id) or (None, None)
     is_linked = bool(linked_player)
 
-    data = await fetch_loot_pool(raid_type)
-    if not data:
+    pool = await fetch_loot_pool(raid_type)
+    if not pool:
         if edit:
             await interaction.edit_original_response(content=f"No loot pool available for {raid_type}.", embeds=[], view=None)
         else:
             await interaction.followup.send(f"No loot pool available for {raid_type}.", ephemeral=True)
         return
 
-    aspects_list = sort_aspects_by_rarity(data.get("aspects", []))
+    aspects_list = pool.aspects
     score_text = None
     player_aspects = {}
 
-    if linked_player:
-        player_data = await fetch_player_aspects(linked_player)
+    if linked_player and not has_budget(OPTIONAL_ENRICHMENT_MIN_BUDGET):
+        score_text = "*Your score is unavailable right now, try again in a moment.*"
+    elif linked_player:
+        player_data = await fetch_linked_aspects(linked_player, linked_uuid)
         if player_data:
             for pa in player_data.get("aspects", []):
                 player_aspects[pa.get("name", "")] = pa.get("amount", 0)
 
-            pool_score = calculate_pool_score(aspects_list, player_aspects, raid_type)
+            pool_score = calculate_pool_score(pool.aspects, player_aspects)
             if pool_score == 0:
                 score_text = "**Your Score:** MAXED"
             else:
@@ -2267,23 +3408,22 @@ async def show_raid_pool(interaction: discord.Interaction, raid_type: str, follo
     # Create separate embeds per rarity with aspects listed vertically
     embeds = [embed]
     for rarity in ["Mythic", "Fabled", "Legendary"]:
-        rarity_aspects = [a for a in aspects_list if a.get("rarity") == rarity]
+        rarity_aspects = pool.by_rarity[rarity]
         if not rarity_aspects:
             continue
 
         # Build text with each aspect on its own line
         aspect_lines = []
         for aspect in rarity_aspects:
-            aspect_name = aspect.get("name", "")
-            aspect_rarity = aspect.get("rarity", "").lower()
+            aspect_name = aspect.name
+            aspect_rarity = aspect.rarity_key
             required_class = get_aspect_class(aspect_name, class_mapping)
 
             # Check if user has maxed this aspect
             is_maxed = False
             player_amount = player_aspects.get(aspect_name, 0)
             if aspect_name in player_aspects:
-                max_threshold = ASPECT_MAX_THRESHOLDS.get(aspect_rarity, 150)
-                is_maxed = player_amount >= max_threshold
+                is_maxed = player_amount >= aspect.max_amount
 
             # Apply filter
             if filter_mode == "maxed" and not is_maxed:
@@ -2301,16 +3441,9 @@ async def show_raid_pool(interaction: discord.Interaction, raid_type: str, follo
             # Build display text with progress for non-maxed filter
             display_text = f"{emoji} {aspect_name}"
             if filter_mode == "non_maxed" and player_aspects:
-                current_tier, target_tier, remaining = get_tier_info(aspect_rarity, player_amount)
-                if current_tier > 0:
-                    # Get tier thresholds to show progress
-                    thresholds = TIER_THRESHOLDS.get(aspect_rarity, [1, 15, 75])
-                    if current_tier <= len(thresholds):
-                        tier_start = thresholds[current_tier - 1] if current_tier > 1 else 0
-                        tier_end = thresholds[current_tier] if current_tier < len(thresholds) else thresholds[-1]
-                        progress_in_tier = player_amount - tier_start
-                        tier_size = tier_end - tier_start
-                        display_text += f" ({progress_in_tier}/{tier_size})"
+                step = tier_step(aspect_rarity, player_amount)
+                if step.current_tier > 0:
+                    display_text += f" ({step.progress}/{step.tier_size})"
 
             aspect_lines.append(display_text)
 
@@ -2376,18 +3509,61 @@ async def lootrunpool(interaction: discord.Interaction, lootrun: app_commands.Ch
 
 
 # === Profile Viewer ===
-class ProfileView(discord.ui.View):
+def compact_profile(data: dict) -> dict:
+    """Keep only the parts of a fullResult player payload that the /pv tabs read."""
+    compact = {key: data[key] for key in ("username", "online", "server", "supportRank", "rank", "playtime", "ranking", "globalData") if key in data}
+    guild = data.get("guild")
+    if guild:
+        compact["guild"] = {"name": guild.get("name"), "rank": guild.get("rank")}
+    compact["characters"] = {
+        char_uuid: {key: char_data[key] for key in ("type", "level", "totalLevel", "professions") if key in char_data}
+        for char_uuid, char_data in (data.get("characters") or {}).items()
+    }
+    return compact
+
+
+class ProfileView(DeadlineView):
     TABS = ["General", "Raids", "Rankings", "Dungeons", "Profs", "Aspects", "Misc"]
 
     def __init__(self, player_data: dict, uuid: str, current_tab: str = "General", aspects_data: dict = None, original_user_id: int = None):
         super().__init__(timeout=300)
-        self.player_data = player_data
+        self.player_data = compact_profile(player_data)
         self.uuid = uuid
         self.current_tab = current_tab
         self.aspects_data = aspects_data
+        self.aspects_task = None
         self.original_user_id = original_user_id
+        self._embeds: dict[str, discord.Embed] = {}
         self._build_buttons()
 
+    def prefetch_aspects(self):
+        """Start loading the Aspects tab data so the click doesn't have to wait for it."""
+        if self.aspects_data is None and self.aspects_task is None:
+            self.aspects_task = spawn_background(self._load_aspects())
+
+    async def _load_aspects(self) -> dict | None:
+        # Not bound to the budget of the interaction that started the prefetch;
+        # the click that awaits this has its own
+        request_deadline.set(None)
+        aspects_data, class_mapping = await asyncio.gather(
+            fetch_aspects_by_uuid(self.uuid), get_aspect_class_mapping(), return_exceptions=True
+        )
+        if isinstance(class_mapping, Exception):
+            logger.warning(f"Aspect class mapping prefetch failed: {class_mapping}")
+        if isinstance(aspects_data, Exception):
+            logger.warning(f"Aspects prefetch for {self.uuid} failed: {aspects_data}")
+            return None
+        return aspects_data
+
+    async def _get_aspects(self) -> dict | None:
+        if self.aspects_data is not None:
+            return self.aspects_data
+        # Retry if the prefetch finished without data (upstream hiccup)
+        if self.aspects_task is None or (self.aspects_task.done() and self.aspects_task.result() is None):
+            self.aspects_task = spawn_background(self._load_aspects())
+        self.aspects_data = await asyncio.shield(self.aspects_task)
+        return self.aspects_data
+
     def _build_buttons(self):
         buttons = []
         for tab in self.TABS:
@@ -2411,33 +3587,41 @@ class ProfileView(discord.ui.View):
 
             await interaction.response.defer()
 
-            # For Aspects tab, we need to fetch data
-            aspects_data = self.aspects_data
-            if tab == "Aspects" and not aspects_data:
-                # Fetch aspects from WynnExtras API
-                aspects_data = await fetch_aspects_by_uuid(self.uuid)
+            embed = await self.tab_embed(tab)
 
-            embed = await self._get_embed_async(tab, aspects_data)
-            new_view = ProfileView(self.player_data, self.uuid, current_tab=tab, aspects_data=aspects_data, original_user_id=self.original_user_id)
-            await interaction.edit_original_response(embed=embed, view=new_view)
+            # Reuse this view: only the set of tab buttons changes
+            self.current_tab = tab
+            self.clear_items()
+            self._build_buttons()
+            await interaction.edit_original_response(embed=embed, view=self)
         return callback
 
-    async def _get_embed_async(self, tab: str, aspects_data: dict = None) -> discord.Embed:
-        if tab == "General":
-            return build_general_embed(self.player_data)
+    async def tab_embed(self, tab: str) -> discord.Embed:
+        """Build the embed for a tab once and reuse it on later clicks."""
+        embed = self._embeds.get(tab)
+        if embed is not None:
+            return embed
+
+        if tab == "Aspects":
+            # Awaits the prefetch started by /pv (or starts it now)
+            aspects_data = await self._get_aspects()
+            embed = await build_aspects_embed(self.player_data, aspects_data)
+            if aspects_data is None:
+                return embed  # Don't memoize a failed load; the next click retries
         elif tab == "Raids":
-            return build_raids_embed(self.player_data)
+            embed = build_raids_embed(self.player_data)
         elif tab == "Rankings":
-            return build_rankings_embed(self.player_data)
+            embed = build_rankings_embed(self.player_data)
         elif tab == "Dungeons":
-            return build_dungeons_embed(self.player_data)
+            embed = build_dungeons_embed(self.player_data)
         elif tab == "Profs":
-            return build_profs_embed(self.player_data)
-        elif tab == "Aspects":
-            return await build_aspects_embed(self.player_data, aspects_data)
+            embed = build_profs_embed(self.player_data)
         elif tab == "Misc":
-            return build_misc_embed(self.player_data)
-        return build_general_embed(self.player_data)
+            embed = build_misc_embed(self.player_data)
+        else:
+            embed = build_general_embed(self.player_data)
+        self._embeds[tab] = embed
+        return embed
 
 
 def build_general_embed(data: dict) -> discord.Embed:
@@ -2836,38 +4020,47 @@ def build_misc_embed(data: dict) -> discord.Embed:
 
 
 @bot.tree.command(name="pv", description="View a player's Wynncraft profile")
-@app_commands.describe(player="Minecraft username to look up (leave empty to use linked account)")
-async def pv(interaction: discord.Interaction, player: str = None):
+@app_commands.describe(
+    player="Minecraft username to look up (leave empty to use linked account)",
+    refresh="Fetch the latest profile instead of a copy from the last couple of minutes"
+)
+@app_commands.autocomplete(player=player_name_autocomplete)
+async def pv(interaction: discord.Interaction, player: str = None, refresh: bool = False):
     await interaction.response.defer()
 
     # If no player specified, use linked account
+    uuid = None
     if not player:
-        player = await get_linked_player(interaction.user.id)
-        if not player:
+        linked = await get_linked_account(interaction.user.id)
+        if not linked:
             await interaction.followup.send("No player specified and you don't have a linked account. Use `/link` first or specify a player name.", ephemeral=True)
             return
+        player, uuid = linked
 
-    # Get UUID from Mojang
-    uuid = await fetch_player_uuid(player)
-    if not uuid:
-        await interaction.followup.send(f"Player **{player}** not found.", ephemeral=True)
-        return
+    # Fetch Wynncraft data, resolving the name in the same call unless the link stores the UUID
+    if uuid:
+        data = await fetch_wynncraft_player(uuid, refresh)
+    else:
+        uuid, data = await fetch_wynncraft_player_by_name(player, refresh)
+        if not uuid:
+            await interaction.followup.send(f"Player **{player}** not found.", ephemeral=True)
+            return
 
-    # Fetch Wynncraft data
-    data = await fetch_wynncraft_player(uuid)
     if not data:
         await interaction.followup.send(f"Could not fetch Wynncraft data for **{player}**. They may have never played Wynncraft.", ephemeral=True)
         return
 
-    # Build initial embed (General tab)
-    embed = build_general_embed(data)
+    remember_player_name(data.get("username") or player)
 
-    # Send with tab buttons
-    await interaction.followup.send(embed=embed, view=ProfileView(data, uuid, original_user_id=interaction.user.id))
+    # Send the General tab with tab buttons, loading the Aspects tab in the meantime
+    view = ProfileView(data, uuid, original_user_id=interaction.user.id)
+    view.prefetch_aspects()
+    await interaction.followup.send(embed=await view.tab_embed("General"), view=view)
 
 
 @bot.tree.command(name="link", description="Link your Discord to a Minecraft account")
 @app_commands.describe(player="Minecraft username to link (leave empty to see current link)")
+@app_commands.autocomplete(player=player_name_autocomplete)
 async def link(interaction: discord.Interaction, player: str = None):
     discord_id = interaction.user.id
 
@@ -2890,11 +4083,12 @@ async def link(interaction: discord.Interaction, player: str = None):
         return
 
     await interaction.response.defer(ephemeral=True)
-    data = await fetch_player_aspects(player)
+    player_uuid = await resolve_player_uuid(player)
+    data = await fetch_aspects_by_uuid(player_uuid) if player_uuid else None
 
     # Use the player name from data if available, otherwise use what they typed
     player_name = data.get("playerName", player) if data else player
-    await set_linked_player(discord_id, player_name)
+    await set_linked_player(discord_id, player_name, player_uuid)
 
     embed = discord.Embed(
         title="✅ Account Linked!",
@@ -2903,7 +4097,7 @@ async def link(interaction: discord.Interaction, player: str = None):
     )
 
     if data:
-        embed.add_field(name="Next Steps", value="`/pv` - View your profile\n`/lootpool` - View all loot pools\n`/raidpool` - View raid loot pools with your score\n`/lootrunpool` - View lootrun loot pools", inline=False)
+        embed.add_field(name="Next Steps", value="`/pv` - View your profile\n`/lootpool` - View all loot pools\n`/raidpool` - View raid loot pools with your score\n`/bestraid` - Rank this week's raids by your score\n`/lootrunpool` - View lootrun loot pools", inline=False)
     else:
         embed.add_field(name="Next Steps", value="`/pv` - View your profile\n`/lootpool` - View all loot pools\n\n*Upload aspects from the mod to see your personalized scores!*", inline=False)
 
@@ -3029,15 +4223,14 @@ def _render_leaderboard_png(guilds: list, season) -> bytes:
 async def lb(interaction: discord.Interaction):
     await interaction.response.defer()
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.get(
-                "https://teslanator20.github.io/srlb/data.json",
-                params={"_": str(int(datetime.now(timezone.utc).timestamp()))},
-                headers={"Cache-Control": "no-cache"},
-                timeout=aiohttp.ClientTimeout(total=15),
-            ) as resp:
-                resp.raise_for_status()
-                data = await resp.json(content_type=None)
+        status, data = await fetch_json(
+            "https://teslanator20.github.io/srlb/data.json",
+            params={"_": str(int(datetime.now(timezone.utc).timestamp()))},
+            headers={"Cache-Control": "no-cache"},
+            conditional=True,
+        )
+        if status != 200:
+            raise RuntimeError(f"leaderboard unavailable (HTTP {status})")
 
         guilds = (data.get("guilds") or [])[:10]
         season = data.get("season", "—")